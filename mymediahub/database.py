@@ -1,12 +1,178 @@
 import sqlite3
+import sys
+import threading
+from contextlib import contextmanager
 from dataclasses import dataclass
-from typing import List, Optional
+from functools import lru_cache, wraps
+from itertools import starmap
+from typing import Dict, Iterator, List, Optional, Tuple
 from datetime import datetime
 
+from setup_database import MEDIA_INDEXES, USERS_DB, setup_media_database
 
-@dataclass
+# Open connections shared by every model, keyed on database path
+_CONN_POOL: Dict[str, sqlite3.Connection] = {}
+# Extra connections for reads made off the Tk thread, keyed on (path, thread id)
+_READ_POOL: Dict[Tuple[str, int], sqlite3.Connection] = {}
+_POOL_LOCK = threading.Lock()
+
+# Rows fetched per round trip when iterating over large result sets
+_FETCH_BATCH_SIZE = 512
+# Values bound per IN (...) lookup, well under SQLite's parameter limit
+_PARAM_BATCH_SIZE = 500
+
+# Selected in Media field order so rows can be passed straight to Media(*row)
+_MEDIA_COLUMNS = """
+    id, title, media_type, genre, release_date, director,
+    description, rating, status, image_path, date_added
+"""
+
+# Just the library grid's columns, returned as plain tuples
+_ROW_COLUMNS = "id, title, media_type, genre, release_year, director, rating, status"
+
+# SQL is kept in module-level constants so every call passes the same string
+# object and hits the connection's prepared statement cache
+_SQL_GET_ROWS = f"SELECT {_ROW_COLUMNS} FROM Media ORDER BY date_added DESC"
+_SQL_GET = f"SELECT {_MEDIA_COLUMNS} FROM Media WHERE id = ?"
+_SQL_GET_ALL = f"SELECT {_MEDIA_COLUMNS} FROM Media ORDER BY date_added DESC"
+_SQL_INSERT = """
+    INSERT INTO Media (title, media_type, genre, release_date, director,
+                       description, rating, status, image_path, release_year)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+# RETURNING hands back the new id from the INSERT itself (SQLite 3.35+)
+_HAS_RETURNING = sqlite3.sqlite_version_info >= (3, 35, 0)
+_SQL_INSERT_RETURNING = _SQL_INSERT.rstrip() + " RETURNING id"
+_SQL_UPDATE = """
+    UPDATE Media SET title=?, media_type=?, genre=?, release_date=?,
+    director=?, description=?, rating=?, status=?, image_path=?, release_year=?
+    WHERE id=?
+"""
+_SQL_DELETE = "DELETE FROM Media WHERE id = ?"
+# The rating filter matches idx_media_rating, so the average is read from the
+# partial index and the count from the smallest covering index
+_SQL_STATS_TOTALS = """
+    SELECT COUNT(*), (SELECT AVG(rating) FROM Media WHERE rating IS NOT NULL)
+    FROM Media
+"""
+# Ordered so the breakdown dicts come back already sorted for display
+_SQL_STATS_BY_TYPE = "SELECT media_type, COUNT(*) FROM Media GROUP BY media_type ORDER BY media_type"
+_SQL_STATS_BY_STATUS = "SELECT status, COUNT(*) FROM Media GROUP BY status ORDER BY status"
+
+
+def _get_conn(path: str) -> sqlite3.Connection:
+    """Return the shared connection for a database file, opening it on first use"""
+    with _POOL_LOCK:
+        if path not in _CONN_POOL:
+            # Autocommit mode: transactions are opened explicitly where needed
+            conn = sqlite3.connect(
+                path, check_same_thread=False, cached_statements=256, isolation_level=None
+            )
+            # Bounds the rows ANALYZE samples when PRAGMA optimize runs
+            conn.execute("PRAGMA analysis_limit=400")
+            _CONN_POOL[path] = conn
+        return _CONN_POOL[path]
+
+
+def _get_read_conn(path: str) -> sqlite3.Connection:
+    """Return the calling thread's connection for reads, opening it on first use"""
+    # Workers never share a statement or transaction with the Tk thread; WAL lets both read at once
+    key = (path, threading.get_ident())
+    with _POOL_LOCK:
+        if key not in _READ_POOL:
+            _READ_POOL[key] = sqlite3.connect(
+                path, check_same_thread=False, cached_statements=256, isolation_level=None
+            )
+        return _READ_POOL[key]
+
+
+def close_all_connections():
+    """Close every pooled connection; call once at application shutdown"""
+    with _POOL_LOCK:
+        for conn in _CONN_POOL.values():
+            # Refreshes planner statistics for tables whose queries would benefit
+            conn.execute("PRAGMA optimize")
+            conn.close()
+        _CONN_POOL.clear()
+        for conn in _READ_POOL.values():
+            conn.close()
+        _READ_POOL.clear()
+
+
+@contextmanager
+def _transaction(conn: sqlite3.Connection):
+    """Run the enclosed statements in a single transaction"""
+    # Issued on the connection so model cursors keep their rowcount
+    conn.execute("BEGIN")
+    try:
+        yield
+    except BaseException:
+        conn.execute("ROLLBACK")
+        raise
+    conn.execute("COMMIT")
+
+
+def _like_escape(text: str) -> str:
+    """Escape LIKE wildcards so text is matched literally (pair with ESCAPE '\\')"""
+    return text.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def _filter_where(by_type: bool, by_status: bool, by_title: bool) -> str:
+    """Build the WHERE clause for a set of type, status and title LIKE filters"""
+    # Conditions follow idx_media_type_status column order so the
+    # equality filters form one index range
+    where_parts = []
+    if by_type:
+        where_parts.append("media_type = ?")
+    if by_status:
+        where_parts.append("status = ?")
+    if by_title:
+        where_parts.append("title LIKE ? ESCAPE '\\'")
+    return f"WHERE {' AND '.join(where_parts)}" if where_parts else ""
+
+
+def _filter_params(media_type: Optional[str], status: Optional[str], title: Optional[str]) -> list:
+    """Return the parameters for a _filter_where clause, in its condition order"""
+    params = []
+    if media_type is not None:
+        params.append(media_type)
+    if status is not None:
+        params.append(status)
+    if title is not None:
+        params.append(f"%{_like_escape(title)}%")
+    return params
+
+
+@lru_cache(maxsize=None)
+def _build_rows_sql(by_type: bool, by_status: bool, by_title: bool) -> str:
+    """Build the SELECT used by DatabaseModel.search_rows for a set of filters"""
+    where = _filter_where(by_type, by_status, by_title)
+    return f"SELECT {_ROW_COLUMNS} FROM Media {where} ORDER BY date_added DESC"
+
+
+@lru_cache(maxsize=None)
+def _build_media_sql(by_type: bool, by_status: bool, by_title: bool) -> str:
+    """Build the SELECT used by the Media-returning search and filter methods"""
+    where = _filter_where(by_type, by_status, by_title)
+    return f"SELECT {_MEDIA_COLUMNS} FROM Media {where} ORDER BY title ASC"
+
+
+def _db_errors(message):
+    """Re-raise sqlite3 errors from a write method with a user-facing message"""
+    def decorator(method):
+        @wraps(method)
+        def wrapper(*args, **kwargs):
+            try:
+                return method(*args, **kwargs)
+            except sqlite3.Error as e:
+                raise Exception(f"{message}: {e}")
+        return wrapper
+    return decorator
+
+
+@dataclass(slots=True, frozen=True)
 class Media:
-    """Represents a single media item"""
+    """Represents a single media item (immutable; use dataclasses.replace to edit)"""
     id: Optional[int] = None
     title: str = ""
     media_type: str = ""
@@ -20,6 +186,21 @@ class Media:
     date_added: str = ""
 
 
+def _release_year(release_date: str) -> Optional[int]:
+    """Return the year of a "Month D, YYYY" release date, or None if it has none"""
+    parts = release_date.split() if release_date else ()
+    if len(parts) >= 3 and parts[-1].isdigit():
+        return int(parts[-1])
+    return None
+
+
+def _grid_row(media_id, title, media_type, genre, release_year, director, rating, status):
+    """Build a _ROW_COLUMNS row with its category strings interned"""
+    # One object per category string, so comparing reloaded rows checks pointers
+    return (media_id, title, sys.intern(media_type), sys.intern(genre) if genre else genre,
+            release_year, director, rating, sys.intern(status) if status else status)
+
+
 class DatabaseModel:
     """Handles all database operations for media items"""
 
@@ -28,169 +209,201 @@ class DatabaseModel:
         self.db_name = db_name
         self.conn = None
         self.cursor = None
+
+        # Bumped on every write; cached reads are keyed on it so any change
+        # to the table makes older cache entries unreachable
+        self._version = 0
+        self._get_record_cached = lru_cache(maxsize=512)(self._fetch_record)
+        self._get_statistics_cached = lru_cache(maxsize=1)(self._fetch_statistics)
+
+        # Editable columns last read or written per media id, so
+        # update_record can skip writes that change nothing
+        self._row_values: Dict[int, tuple] = {}
+
         self.connect()
 
     def connect(self):
         """Connect to the database"""
         try:
-            self.conn = sqlite3.connect(self.db_name)
-            self.conn.row_factory = sqlite3.Row
+            self.conn = _get_conn(self.db_name)
             self.cursor = self.conn.cursor()
+
+            # WAL + NORMAL sync avoids an fsync on every committed write
+            self.cursor.execute("PRAGMA journal_mode=WAL")
+            self.cursor.execute("PRAGMA synchronous=NORMAL")
+            self.cursor.execute("PRAGMA temp_store=MEMORY")
+            self.cursor.execute("PRAGMA cache_size=-20000")
+
+            self._add_release_year()
+            self._create_indexes()
+            # Gathers statistics for new indexes so the planner can choose between them
+            self.cursor.execute("PRAGMA optimize=0x10002")
         except sqlite3.Error as e:
             raise Exception(f"Database connection error: {e}")
 
+    def _add_release_year(self):
+        """Add and fill the release_year column in libraries created before it"""
+        self.cursor.execute("PRAGMA table_info(Media)")
+        if any(column[1] == "release_year" for column in self.cursor.fetchall()):
+            return
+        with _transaction(self.conn):
+            self.cursor.execute("ALTER TABLE Media ADD COLUMN release_year INTEGER")
+            self.cursor.execute("SELECT id, release_date FROM Media")
+            years = [(_release_year(release_date), media_id)
+                     for media_id, release_date in self.cursor.fetchall()]
+            self.cursor.executemany(
+                "UPDATE Media SET release_year = ? WHERE id = ?",
+                [(year, media_id) for year, media_id in years if year is not None]
+            )
+
+    def _create_indexes(self):
+        """Create indexes used by the list, search and filter queries"""
+        for statement in MEDIA_INDEXES:
+            self.cursor.execute(statement)
+
     def close(self):
-        """Close database connection"""
-        if self.conn:
-            self.conn.close()
+        """Release this model's cursor; the pooled connection stays open"""
+        if self.cursor:
+            self.cursor.close()
+            self.cursor = None
+
+    def get_all_rows(self) -> List[tuple]:
+        """Retrieve all media items as _ROW_COLUMNS tuples, newest first"""
+        return list(starmap(_grid_row, _get_read_conn(self.db_name).execute(_SQL_GET_ROWS)))
+
+    def search_rows(self, *, title: Optional[str] = None, media_type: Optional[str] = None,
+                    status: Optional[str] = None) -> List[tuple]:
+        """Retrieve rows containing title literally (ASCII-only case folding) and matching the filters"""
+        params = _filter_params(media_type, status, title)
+        sql = _build_rows_sql(media_type is not None, status is not None, title is not None)
+        return list(starmap(_grid_row, _get_read_conn(self.db_name).execute(sql, params)))
+
+    def get_record(self, media_id: int) -> Optional[Media]:
+        """Retrieve a specific media item by ID (cached until the next write)"""
+        return self._get_record_cached(media_id, self._version)
+
+    def _fetch_record(self, media_id: int, version: int) -> Optional[Media]:
+        """Query a media item by ID; version is only part of the cache key"""
+        self.cursor.execute(_SQL_GET, (media_id,))
+        return self._row_to_media(self.cursor.fetchone())
 
     def get_all_records(self) -> List[Media]:
         """Retrieve all media items from database"""
-        try:
-            self.cursor.execute("SELECT * FROM Media ORDER BY date_added DESC")
-            rows = self.cursor.fetchall()
-            return [self._row_to_media(row) for row in rows]
-        except sqlite3.Error as e:
-            raise Exception(f"Error retrieving records: {e}")
+        return list(self.iter_all_records())
 
-    def get_record(self, media_id: int) -> Optional[Media]:
-        """Retrieve a specific media item by ID"""
-        try:
-            self.cursor.execute("SELECT * FROM Media WHERE id = ?", (media_id,))
-            row = self.cursor.fetchone()
-            return self._row_to_media(row) if row else None
-        except sqlite3.Error as e:
-            raise Exception(f"Error retrieving record: {e}")
+    def iter_all_records(self) -> Iterator[Media]:
+        """Iterate over all media items, newest first"""
+        return self._iter_media(_SQL_GET_ALL, ())
 
     def search_by_title(self, title: str) -> List[Media]:
         """Search media items by title (case-insensitive)"""
-        try:
-            self.cursor.execute(
-                "SELECT * FROM Media WHERE title LIKE ? ORDER BY title ASC",
-                (f"%{title}%",)
-            )
-            rows = self.cursor.fetchall()
-            return [self._row_to_media(row) for row in rows]
-        except sqlite3.Error as e:
-            raise Exception(f"Error searching: {e}")
+        return list(self.iter_search_by_title(title))
+
+    def iter_search_by_title(self, title: str) -> Iterator[Media]:
+        """Iterate over media items whose title contains the search text"""
+        return self._iter_media(_build_media_sql(False, False, True), _filter_params(None, None, title))
 
     def filter_by_type(self, media_type: str) -> List[Media]:
         """Filter media items by type"""
-        try:
-            self.cursor.execute(
-                "SELECT * FROM Media WHERE media_type = ? ORDER BY title ASC",
-                (media_type,)
-            )
-            rows = self.cursor.fetchall()
-            return [self._row_to_media(row) for row in rows]
-        except sqlite3.Error as e:
-            raise Exception(f"Error filtering: {e}")
+        return list(self._iter_media(_build_media_sql(True, False, False), (media_type,)))
 
     def filter_by_status(self, status: str) -> List[Media]:
         """Filter media items by status"""
-        try:
-            self.cursor.execute(
-                "SELECT * FROM Media WHERE status = ? ORDER BY title ASC",
-                (status,)
-            )
-            rows = self.cursor.fetchall()
-            return [self._row_to_media(row) for row in rows]
-        except sqlite3.Error as e:
-            raise Exception(f"Error filtering: {e}")
+        return list(self._iter_media(_build_media_sql(False, True, False), (status,)))
 
+    @_db_errors("Error creating record")
     def create_record(self, media: Media) -> int:
         """Insert a new media item into the database"""
-        try:
-            self.cursor.execute("""
-                INSERT INTO Media (title, media_type, genre, release_date, director, 
-                                 description, rating, status, image_path)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                media.title, media.media_type, media.genre, media.release_date,
-                media.director, media.description, media.rating, media.status, media.image_path
-            ))
-            self.conn.commit()
-            return self.cursor.lastrowid
-        except sqlite3.Error as e:
-            raise Exception(f"Error creating record: {e}")
+        with _transaction(self.conn):
+            if _HAS_RETURNING:
+                # Fetched inside the transaction so the statement is finished before COMMIT
+                self.cursor.execute(_SQL_INSERT_RETURNING, self._media_to_params(media))
+                media_id = self.cursor.fetchone()[0]
+            else:
+                self.cursor.execute(_SQL_INSERT, self._media_to_params(media))
+                media_id = self.cursor.lastrowid
+        self._version += 1
+        return media_id
+
+    @_db_errors("Error creating records")
+    def bulk_create(self, medias: List[Media]) -> int:
+        """Insert many media items in a single transaction"""
+        with _transaction(self.conn):
+            self.cursor.executemany(_SQL_INSERT, [self._media_to_params(m) for m in medias])
+        self._version += 1
+        return self.cursor.rowcount
 
+    @_db_errors("Error updating record")
     def update_record(self, media: Media) -> bool:
-        """Update an existing media item"""
-        try:
-            self.cursor.execute("""
-                UPDATE Media SET title=?, media_type=?, genre=?, release_date=?, 
-                director=?, description=?, rating=?, status=?, image_path=?
-                WHERE id=?
-            """, (
-                media.title, media.media_type, media.genre, media.release_date,
-                media.director, media.description, media.rating, media.status,
-                media.image_path, media.id
-            ))
-            self.conn.commit()
-            return self.cursor.rowcount > 0
-        except sqlite3.Error as e:
-            raise Exception(f"Error updating record: {e}")
+        """Update an existing media item; unchanged items are not rewritten"""
+        params = self._media_to_params(media)
+        # release_year follows from release_date, so it is left out of the comparison
+        row_values = params[:-1]
+        if self._row_values.get(media.id) == row_values:
+            return True
 
+        with _transaction(self.conn):
+            self.cursor.execute(_SQL_UPDATE, params + (media.id,))
+        self._version += 1
+        updated = self.cursor.rowcount > 0
+        if updated:
+            self._row_values[media.id] = row_values
+        return updated
+
+    @_db_errors("Error deleting record")
     def delete_record(self, media_id: int) -> bool:
         """Delete a media item from the database"""
-        try:
-            self.cursor.execute("DELETE FROM Media WHERE id = ?", (media_id,))
-            self.conn.commit()
-            return self.cursor.rowcount > 0
-        except sqlite3.Error as e:
-            raise Exception(f"Error deleting record: {e}")
+        with _transaction(self.conn):
+            self.cursor.execute(_SQL_DELETE, (media_id,))
+        self._version += 1
+        self._row_values.pop(media_id, None)
+        return self.cursor.rowcount > 0
 
     def get_statistics(self) -> dict:
-        """Get statistics about the media library"""
-        try:
-            stats = {}
-
-            self.cursor.execute("SELECT COUNT(*) FROM Media")
-            stats['total_items'] = self.cursor.fetchone()[0]
-
-            self.cursor.execute("SELECT DISTINCT media_type FROM Media")
-            types = self.cursor.fetchall()
-            stats['type_breakdown'] = {}
-            for type_row in types:
-                media_type = type_row[0]
-                self.cursor.execute("SELECT COUNT(*) FROM Media WHERE media_type = ?", (media_type,))
-                count = self.cursor.fetchone()[0]
-                stats['type_breakdown'][media_type] = count
-
-            self.cursor.execute("SELECT DISTINCT status FROM Media")
-            statuses = self.cursor.fetchall()
-            stats['status_breakdown'] = {}
-            for status_row in statuses:
-                status = status_row[0]
-                self.cursor.execute("SELECT COUNT(*) FROM Media WHERE status = ?", (status,))
-                count = self.cursor.fetchone()[0]
-                stats['status_breakdown'][status] = count
-
-            self.cursor.execute("SELECT AVG(rating) FROM Media WHERE rating IS NOT NULL")
-            avg_rating = self.cursor.fetchone()[0]
-            stats['average_rating'] = round(avg_rating, 1) if avg_rating else 0
-
-            return stats
-        except sqlite3.Error as e:
-            raise Exception(f"Error getting statistics: {e}")
+        """Get statistics about the media library (the same dict until the next write)"""
+        return self._get_statistics_cached(self._version)
+
+    def _fetch_statistics(self, version: int) -> dict:
+        """Query library statistics; version is only part of the cache key"""
+        stats = {}
+
+        self.cursor.execute(_SQL_STATS_TOTALS)
+        total_items, avg_rating = self.cursor.fetchone()
+        stats['total_items'] = total_items
+
+        self.cursor.execute(_SQL_STATS_BY_TYPE)
+        stats['type_breakdown'] = dict(self.cursor.fetchall())
+
+        self.cursor.execute(_SQL_STATS_BY_STATUS)
+        stats['status_breakdown'] = dict(self.cursor.fetchall())
+
+        stats['average_rating'] = round(avg_rating, 1) if avg_rating else 0
+
+        return stats
 
-    def _row_to_media(self, row) -> Media:
-        """Convert a database row to a Media object"""
+    def _media_to_params(self, media: Media) -> tuple:
+        """Convert a Media object to INSERT/UPDATE column parameters, release_year last"""
+        return (
+            media.title, media.media_type, media.genre, media.release_date,
+            media.director, media.description, media.rating, media.status, media.image_path,
+            _release_year(media.release_date)
+        )
+
+    def _row_to_media(self, row) -> Optional[Media]:
+        """Convert a database row tuple to a Media object"""
         if row is None:
             return None
-        return Media(
-            id=row['id'],
-            title=row['title'],
-            media_type=row['media_type'],
-            genre=row['genre'],
-            release_date=row['release_date'],
-            director=row['director'],
-            description=row['description'],
-            rating=row['rating'],
-            status=row['status'],
-            image_path=row['image_path'],
-            date_added=row['date_added']
-        )
+        # Columns 1-9 are the editable fields, in _media_to_params order
+        self._row_values[row[0]] = row[1:10]
+        return Media(*row)
+
+    def _iter_media(self, sql: str, params) -> Iterator[Media]:
+        """Yield Media objects for a query, fetching rows in batches"""
+        # A dedicated cursor keeps the iteration valid while other
+        # queries run on self.cursor
+        cursor = self.conn.execute(sql, params)
+        while batch := cursor.fetchmany(_FETCH_BATCH_SIZE):
+            yield from map(self._row_to_media, batch)
 
 
 class UserManager:
@@ -198,7 +411,7 @@ class UserManager:
 
     def __init__(self):
         """Initialize user manager"""
-        self.db_name = "users.db"
+        self.db_name = USERS_DB
         self.conn = None
         self.cursor = None
         self.connect()
@@ -206,16 +419,16 @@ class UserManager:
     def connect(self):
         """Connect to users database"""
         try:
-            self.conn = sqlite3.connect(self.db_name)
-            self.conn.row_factory = sqlite3.Row
+            self.conn = _get_conn(self.db_name)
             self.cursor = self.conn.cursor()
         except sqlite3.Error as e:
             raise Exception(f"User database connection error: {e}")
 
     def close(self):
-        """Close database connection"""
-        if self.conn:
-            self.conn.close()
+        """Close this manager's cursor"""
+        if self.cursor:
+            self.cursor.close()
+            self.cursor = None
 
     def get_all_users(self) -> List[str]:
         """Get list of all usernames"""
@@ -228,14 +441,40 @@ class UserManager:
     def create_user(self, username: str) -> bool:
         """Create a new user"""
         try:
-            self.cursor.execute("INSERT INTO Users (username) VALUES (?)", (username,))
-            self.conn.commit()
+            with _transaction(self.conn):
+                self.cursor.execute("INSERT INTO Users (username) VALUES (?)", (username,))
 
-            from setup_database import setup_media_database
             setup_media_database(username)
 
             return True
         except sqlite3.IntegrityError:
             return False
         except sqlite3.Error as e:
-            raise Exception(f"Error creating user: {e}")
\ No newline at end of file
+            raise Exception(f"Error creating user: {e}")
+
+    @_db_errors("Error creating users")
+    def bulk_create_users(self, usernames: List[str]) -> int:
+        """Create many users in a single transaction, skipping existing names"""
+        new_names = list(dict.fromkeys(usernames))
+        with _transaction(self.conn):
+            # Existing names are looked up a batch at a time, so only new
+            # users get a media database set up
+            existing = set()
+            for start in range(0, len(new_names), _PARAM_BATCH_SIZE):
+                batch = new_names[start:start + _PARAM_BATCH_SIZE]
+                placeholders = ", ".join("?" * len(batch))
+                self.cursor.execute(
+                    f"SELECT username FROM Users WHERE username IN ({placeholders})", batch
+                )
+                existing.update(row[0] for row in self.cursor.fetchall())
+            new_names = [username for username in new_names if username not in existing]
+
+            self.cursor.executemany(
+                "INSERT INTO Users (username) VALUES (?)",
+                [(username,) for username in new_names]
+            )
+
+        for username in new_names:
+            setup_media_database(username)
+
+        return len(new_names)
\ No newline at end of file
@@ -1,11 +1,17 @@
 import tkinter as tk
 import tkinter.ttk as ttk
 from tkinter import messagebox, filedialog, font
-from database import DatabaseModel, Media, UserManager
-from PIL import Image, ImageTk
+from database import DatabaseModel, Media, UserManager, close_all_connections
+from placeholder_image import PLACEHOLDER_PNG_B64
+from PIL import Image, ImageDraw, ImageTk
+import base64
+import io
 import os
-import calendar
+import math
+import traceback
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
 
 APP_NAME = "MyMediaHub"
 
@@ -13,16 +19,21 @@ APP_NAME = "MyMediaHub"
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 ASSETS_DIR = os.path.join(SCRIPT_DIR, "assets")
 
-MEDIA_TYPES = ["Book", "Film", "Game", "Audiobook", "Podcast", "TV Show", "Documentary", "Comic", "Anime", "Manga",
-               "Cartoon"]
-STATUSES = ["To Read", "In Progress", "Completed", "On Hold", "Dropped"]
-GENRES = ["Action", "Comedy", "Drama", "Fantasy", "Horror", "Romance", "Sci-Fi", "Thriller", "Mystery", "Adventure",
-          "Biography", "Historical"]
-
-MONTHS = ["January", "February", "March", "April", "May", "June", "July", "August", "September", "October", "November",
-          "December"]
-DAYS = list(range(1, 32))
-YEARS = list(range(1900, 2026))
+# Combobox value lists are built once as tuples of strings, ready to hand to Tk
+MEDIA_TYPES = ("Book", "Film", "Game", "Audiobook", "Podcast", "TV Show", "Documentary", "Comic", "Anime", "Manga",
+               "Cartoon")
+STATUSES = ("To Read", "In Progress", "Completed", "On Hold", "Dropped")
+GENRES = ("Action", "Comedy", "Drama", "Fantasy", "Horror", "Romance", "Sci-Fi", "Thriller", "Mystery", "Adventure",
+          "Biography", "Historical")
+FILTER_MEDIA_TYPES = ("All",) + MEDIA_TYPES
+FILTER_STATUSES = ("All",) + STATUSES
+
+MONTHS = ("January", "February", "March", "April", "May", "June", "July", "August", "September", "October", "November",
+          "December")
+DAYS = tuple(str(day) for day in range(1, 32))
+YEARS = tuple(str(year) for year in range(1900, 2026))
+# Half-point ratings from 0 to 10; the leading blank entry leaves an item unrated
+RATING_VALUES = ("",) + tuple(f"{i / 2:.1f}" for i in range(21))
 
 # Color scheme
 COLORS = {
@@ -40,67 +51,224 @@ COLORS = {
     'border': '#bdc3c7'
 }
 
-# Global image cache to prevent garbage collection
-IMAGE_CACHE = {}
+ICON_MAP = {
+    "Book": "icon_book.png",
+    "Film": "icon_film.png",
+    "Game": "icon_game.png",
+    "Audiobook": "icon_audiobook.png",
+    "Podcast": "icon_podcast.png",
+    "TV Show": "icon_tv.png",
+    "Documentary": "icon_documentary.png",
+    "Comic": "icon_comic.png",
+    "Anime": "icon_anime.png",
+    "Manga": "icon_manga.png",
+    "Cartoon": "icon_cartoon.png"
+}
+
+# Text color of library rows per status, set once as Treeview tags
+STATUS_COLORS = {
+    "To Read": COLORS['text_dark'],
+    "In Progress": COLORS['accent_blue'],
+    "Completed": COLORS['accent_green'],
+    "On Hold": COLORS['accent_orange'],
+    "Dropped": COLORS['accent_red']
+}
+# Pale background of library rows per media type, set once as Treeview tags
+MEDIA_TYPE_COLORS = {
+    "Book": '#fbf5e6',
+    "Comic": '#fbf5e6',
+    "Manga": '#fbf5e6',
+    "Audiobook": '#f4eefa',
+    "Podcast": '#f4eefa',
+    "Film": '#eaf4fb',
+    "TV Show": '#eaf4fb',
+    "Documentary": '#eaf4fb',
+    "Anime": '#fdf0ee',
+    "Cartoon": '#fdf0ee',
+    "Game": '#eafaf1'
+}
+STATUS_TAGS = {status: f"status_{i}" for i, status in enumerate(STATUS_COLORS)}
+MEDIA_TYPE_TAGS = {media_type: f"type_{i}" for i, media_type in enumerate(MEDIA_TYPE_COLORS)}
+# Tag tuples built once per (status, media type), so inserting or updating a row allocates none
+ROW_TAGS = {(status, media_type): (status_tag, type_tag)
+            for status, status_tag in STATUS_TAGS.items()
+            for media_type, type_tag in MEDIA_TYPE_TAGS.items()}
+
+# Search box typing is coalesced into one filter pass per pause this long
+FILTER_DEBOUNCE_MS = 80
+
+# Cover images are decoded and resized off the Tk thread
+_IMG_POOL = ThreadPoolExecutor(max_workers=2)
+COVER_POLL_MS = 50
+
+# The library list is read off the Tk thread; one worker keeps loads in order
+_DB_POOL = ThreadPoolExecutor(max_workers=1)
+LOAD_POLL_MS = 20
 
+# Named fonts shared by every widget, filled once by init_fonts
+FONTS = {}
 
+# Shared tk.Button options by size, filled once by configure_styles; callers
+# add their own bg and command
+BUTTON_STYLES = {}
+
+# Filled once by init_icon_cache after the Tk root exists
+MEDIA_ICONS = {}
+PLACEHOLDER_250x400 = None
+
+
+@lru_cache(maxsize=128)
 def load_image(filename, size=None):
     """Load an image from assets folder with caching"""
+    # size must be a (width, height) tuple; widgets keep their own reference since the cache may evict
     try:
-        filepath = os.path.join(ASSETS_DIR, filename)
-        if not os.path.exists(filepath):
-            return None
-
-        # Check cache first
-        cache_key = f"{filename}_{size}"
-        if cache_key in IMAGE_CACHE:
-            return IMAGE_CACHE[cache_key]
-
-        img = Image.open(filepath)
+        img = Image.open(os.path.join(ASSETS_DIR, filename))
         if size:
             img.thumbnail(size, Image.Resampling.LANCZOS)
-        photo = ImageTk.PhotoImage(img)
-
-        # Cache the image
-        IMAGE_CACHE[cache_key] = photo
-        return photo
+        return ImageTk.PhotoImage(img)
+    except FileNotFoundError:
+        return None
     except Exception as e:
         print(f"Error loading image {filename}: {e}")
         return None
 
 
+@lru_cache(maxsize=None)
+def _placeholder(size):
+    """Decode the embedded cover placeholder, shrunk to fit size"""
+    img = Image.open(io.BytesIO(base64.b64decode(PLACEHOLDER_PNG_B64)))
+    img.thumbnail(size, Image.Resampling.LANCZOS)
+    return ImageTk.PhotoImage(img)
+
+
+def _decode_cover(image_path, size):
+    """Open and shrink a cover image; runs on a loader thread"""
+    img = Image.open(image_path)
+    img.thumbnail(size)
+    return img
+
+
+def init_fonts(root):
+    """Create the shared Helvetica fonts so Tk resolves each one only once"""
+    font_specs = {
+        "small": (9, "normal"),
+        "body_small": (10, "normal"),
+        "body_small_bold": (10, "bold"),
+        "body": (11, "normal"),
+        "body_bold": (11, "bold"),
+        "label": (12, "normal"),
+        "label_bold": (12, "bold"),
+        "large": (14, "normal"),
+        "large_bold": (14, "bold"),
+        "subheader": (16, "normal"),
+        "subheader_bold": (16, "bold"),
+        "header_light": (18, "normal"),
+        "header": (18, "bold"),
+        "title": (20, "bold"),
+        "stat_value": (24, "bold"),
+        "app_title": (32, "bold"),
+        "app_title_large": (36, "bold"),
+        "stat_total": (48, "bold")
+    }
+    for name, (size, weight) in font_specs.items():
+        FONTS[name] = font.Font(root=root, family="Helvetica", size=size, weight=weight)
+
+
+def configure_styles():
+    """Configure the shared ttk label styles once, after the fonts exist"""
+    style = ttk.Style()
+    style.configure("Header.TLabel", background=COLORS['bg_dark'], foreground=COLORS['text_light'],
+                    font=FONTS["header"])
+    style.configure("Section.TLabel", background=COLORS['bg_light'], foreground=COLORS['text_dark'],
+                    font=FONTS["subheader_bold"])
+    style.configure("Field.TLabel", background=COLORS['bg_light'], foreground=COLORS['text_dark'],
+                    font=FONTS["body"])
+    style.configure("Card.TLabel", background="white", foreground=COLORS['text_dark'], font=FONTS["body"])
+    style.configure("CardBold.TLabel", background="white", foreground=COLORS['text_dark'],
+                    font=FONTS["body_bold"])
+
+    # Buttons stay tk.Button so their colors show on Mac, where black text
+    # keeps them readable
+    button_base = {"fg": "black", "relief": "flat", "cursor": "hand2"}
+    for name, font_name, padx, pady in (
+        ("action", "body_bold", 20, 8),
+        ("dialog", "body_bold", 30, 8),
+        ("form", "label_bold", 40, 10),
+        ("small", "body_small_bold", 15, 5),
+    ):
+        BUTTON_STYLES[name] = {**button_base, "font": FONTS[font_name], "padx": padx, "pady": pady}
+
+
+def init_icon_cache():
+    """Load every media-type icon and the cover placeholder once (needs a Tk root)"""
+    global PLACEHOLDER_250x400
+    for media_type, icon_filename in ICON_MAP.items():
+        MEDIA_ICONS[media_type] = load_image(icon_filename, size=(24, 24))
+    PLACEHOLDER_250x400 = _placeholder((250, 400))
+
+
 def get_media_icon(media_type):
     """Get the icon for a specific media type"""
-    icon_map = {
-        "Book": "icon_book.png",
-        "Film": "icon_film.png",
-        "Game": "icon_game.png",
-        "Audiobook": "icon_audiobook.png",
-        "Podcast": "icon_podcast.png",
-        "TV Show": "icon_tv.png",
-        "Documentary": "icon_documentary.png",
-        "Comic": "icon_comic.png",
-        "Anime": "icon_anime.png",
-        "Manga": "icon_manga.png",
-        "Cartoon": "icon_cartoon.png"
-    }
+    return MEDIA_ICONS.get(media_type)
+
 
-    icon_filename = icon_map.get(media_type)
-    if icon_filename:
-        return load_image(icon_filename, size=(24, 24))
-    return None
+# Symbol for every half-point rating from 0 to 10, indexed by ceil(rating * 2);
+# rounding up keeps typed ratings like 5.3 on the right side of each threshold
+_RATING_SYMBOLS = tuple("👎" if r <= 5 else "👍" if r <= 8 else "❤️" for r in (i / 2 for i in range(21)))
+
+
+@lru_cache(maxsize=512)
+def parse_release_date(release_date):
+    """Split a "Month D, YYYY" release date into (month, day, year) strings, or None"""
+    if not release_date:
+        return None
+    try:
+        parsed = datetime.strptime(release_date, "%B %d, %Y")
+        return parsed.strftime("%B"), str(parsed.day), str(parsed.year)
+    except ValueError:
+        # The form allows days a month doesn't have (e.g. February 31)
+        parts = release_date.split()
+        if len(parts) >= 3:
+            return parts[0], parts[1].rstrip(','), parts[2]
+        return None
 
 
 def get_rating_symbol(rating):
     """Convert rating to colored symbol"""
-    if rating is None:
-        return "-"
-    if rating <= 5.0:
-        return "👎"
-    elif rating <= 8.0:
-        return "👍"
-    else:
-        return "❤️"
+    return "-" if rating is None else _RATING_SYMBOLS[math.ceil(rating * 2)]
+
+
+# Cell text for no rating and every half-point rating the form offers
+_RATING_CELLS = {None: "-", 0.0: "-"} | {i / 2: f"{i / 2}/10 {_RATING_SYMBOLS[i]}" for i in range(1, 21)}
+
+
+def rating_cell(rating):
+    """Format a rating with its symbol for display, or "-" when unrated"""
+    cell = _RATING_CELLS.get(rating)
+    if cell is None:
+        # Typed ratings between the half points
+        cell = f"{rating}/10 {get_rating_symbol(rating)}" if rating else "-"
+    return cell
+
+
+def _text_sort_key(text):
+    """Sort key for text columns: case-insensitive, with empty values first"""
+    return (text or "").lower()
+
+
+# Sort keys for the library columns that aren't plain text, applied to the
+# shown values; unknown years and unrated items sort before every real value
+_SORT_KEYS = {
+    "ID": int,
+    "Year": lambda year: year if isinstance(year, int) else -1,
+    "Rating": lambda cell: float(cell.split("/")[0]) if cell != "-" else -1.0,
+}
+
+
+def report_callback_error(exc_type, exc_value, exc_tb):
+    """Show errors raised inside Tk callbacks (e.g. database reads) to the user"""
+    traceback.print_exception(exc_type, exc_value, exc_tb)
+    messagebox.showerror("Error", str(exc_value))
 
 
 def create_header_canvas(parent, width=800, height=100):
@@ -120,7 +288,7 @@ def create_header_canvas(parent, width=800, height=100):
 
     # app title
     canvas.create_text(width // 2, height // 2, text=APP_NAME,
-                       font=("Helvetica", 32, "bold"), fill=COLORS['text_light'])
+                       font=FONTS["app_title"], fill=COLORS['text_light'])
 
     # decorative line
     canvas.create_line(120, height - 10, width - 40, height - 10, fill=COLORS['accent_blue'], width=3)
@@ -132,16 +300,85 @@ def create_decorative_separator(parent, width=600):
     """Create a decorative separator line"""
     canvas = tk.Canvas(parent, width=width, height=20, bg=COLORS['bg_light'], highlightthickness=0)
 
+    # _separator_image's cache keeps the image alive for the whole session
+    canvas.create_image(0, 0, image=_separator_image(width), anchor="nw")
+
+    return canvas
+
+
+@lru_cache(maxsize=None)
+def _separator_image(width):
+    """Render the separator lines once per width into a shared image"""
+    img = Image.new("RGB", (width, 20), COLORS['bg_light'])
+    draw = ImageDraw.Draw(img)
+
     # Create gradient-like effect with multiple lines
     colors = [COLORS['accent_blue'], COLORS['accent_green'], COLORS['accent_purple']]
     for i, color in enumerate(colors):
         y = 10
         x_offset = i * 3
-        canvas.create_line(x_offset, y, width // 3 + x_offset, y, fill=color, width=2)
-        canvas.create_line(width // 3 + 20 + x_offset, y, 2 * width // 3 + x_offset, y, fill=color, width=2)
-        canvas.create_line(2 * width // 3 + 20 + x_offset, y, width + x_offset, y, fill=color, width=2)
+        draw.line((x_offset, y, width // 3 + x_offset, y), fill=color, width=2)
+        draw.line((width // 3 + 20 + x_offset, y, 2 * width // 3 + x_offset, y), fill=color, width=2)
+        draw.line((2 * width // 3 + 20 + x_offset, y, width + x_offset, y), fill=color, width=2)
 
-    return canvas
+    return ImageTk.PhotoImage(img)
+
+
+def create_modal_window(parent, title, width, height):
+    """Create a hidden Toplevel centered over parent; show it with show_modal_window"""
+    window = tk.Toplevel(parent)
+    # Hidden while widgets are built so Tk lays the window out once
+    window.withdraw()
+    window.title(title)
+
+    if parent.winfo_ismapped():
+        x = parent.winfo_rootx() + (parent.winfo_width() - width) // 2
+        y = parent.winfo_rooty() + (parent.winfo_height() - height) // 2
+    else:
+        # Parent not on screen yet (e.g. first-run dialog): center on the screen
+        x = (parent.winfo_screenwidth() - width) // 2
+        y = (parent.winfo_screenheight() - height) // 2
+    window.geometry(f"{width}x{height}+{max(x, 0)}+{max(y, 0)}")
+
+    window.configure(bg=COLORS['bg_light'])
+    window.transient(parent)
+    return window
+
+
+def show_modal_window(window):
+    """Lay out a window built by create_modal_window, show it and grab input"""
+    window.update_idletasks()
+    window.deiconify()
+    window.grab_set()
+
+
+def after_first_paint(window, callback, *args):
+    """Run callback on the idle queue once window is first exposed"""
+    def on_expose(event):
+        window.unbind("<Expose>")
+        # Tk queues the redraw for this Expose before bindings run, so the
+        # callback comes after the first paint
+        window.after_idle(callback, *args)
+
+    window.bind("<Expose>", on_expose)
+
+
+def bind_scroll_region(canvas, frame):
+    """Keep the canvas scroll region fitted to frame, updating once per idle cycle"""
+    pending = False
+
+    def update_region():
+        nonlocal pending
+        pending = False
+        canvas.configure(scrollregion=canvas.bbox("all"))
+
+    def schedule_update(event):
+        nonlocal pending
+        if not pending:
+            pending = True
+            canvas.after_idle(update_region)
+
+    frame.bind("<Configure>", schedule_update)
 
 
 class UserSelectionScreen:
@@ -171,7 +408,7 @@ class UserSelectionScreen:
         tk.Label(
             self.frame,
             text=APP_NAME,
-            font=("Helvetica", 36, "bold"),
+            font=FONTS["app_title_large"],
             bg=COLORS['bg_dark'],
             fg=COLORS['text_light']
         ).pack(pady=10)
@@ -180,14 +417,15 @@ class UserSelectionScreen:
         subtitle = tk.Label(
             self.frame,
             text="Select Your Profile",
-            font=("Helvetica", 18),
+            font=FONTS["header_light"],
             bg=COLORS['bg_dark'],
             fg=COLORS['accent_green']
         )
         subtitle.pack(pady=10)
 
-        user_frame = tk.Frame(self.frame, bg=COLORS['bg_dark'])
-        user_frame.pack(pady=30)
+        self.user_frame = tk.Frame(self.frame, bg=COLORS['bg_dark'])
+        self.user_frame.pack(pady=30)
+        self.welcome_label = None
 
         try:
             users = self.user_manager.get_all_users()
@@ -195,36 +433,53 @@ class UserSelectionScreen:
             if not users:
                 self._show_new_user_prompt()
             else:
-                for user in users:
-                    self._create_user_button(user_frame, user)
-
-                # Add user button with black text (this is for Mac LOL)
-                add_button = tk.Button(
-                    user_frame,
-                    text="+ Add User",
-                    font=("Helvetica", 14, "bold"),
-                    bg=COLORS['accent_green'],
-                    fg="black",  # Black text for Mac
-                    activebackground=COLORS['accent_blue'],
-                    activeforeground="black",
-                    command=self._add_new_user,
-                    padx=30,
-                    pady=15,
-                    relief="flat",
-                    cursor="hand2",
-                    bd=2
-                )
-                add_button.pack(side="left", padx=15)
+                self._populate_users(users)
 
         except Exception as e:
             messagebox.showerror("Error", f"Failed to load users: {e}")
 
+    def _populate_users(self, users):
+        """Create a button per user plus the add user button"""
+        for user in users:
+            self._create_user_button(self.user_frame, user)
+
+        # Add user button with black text (this is for Mac LOL)
+        add_button = tk.Button(
+            self.user_frame,
+            text="+ Add User",
+            font=FONTS["large_bold"],
+            bg=COLORS['accent_green'],
+            fg="black",  # Black text for Mac
+            activebackground=COLORS['accent_blue'],
+            activeforeground="black",
+            command=self._add_new_user,
+            padx=30,
+            pady=15,
+            relief="flat",
+            cursor="hand2",
+            bd=2
+        )
+        add_button.pack(side="left", padx=15)
+
+    def _refresh_users(self):
+        """Rebuild the user buttons after the user list changes"""
+        if self.welcome_label:
+            self.welcome_label.destroy()
+            self.welcome_label = None
+        for widget in self.user_frame.winfo_children():
+            widget.destroy()
+
+        try:
+            self._populate_users(self.user_manager.get_all_users())
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to load users: {e}")
+
     def _create_user_button(self, parent, username):
         """Create a button for a user"""
         user_btn = tk.Button(
             parent,
             text=username,
-            font=("Helvetica", 16, "bold"),
+            font=FONTS["subheader_bold"],
             bg=COLORS['accent_blue'],
             fg="black",  # Black text for Mac
             activebackground=COLORS['accent_blue_hover'],
@@ -242,28 +497,26 @@ class UserSelectionScreen:
         """Handle user selection"""
         self.user_manager.close()
         self.frame.destroy()
+        # Start-screen images are not shown again; preloaded icons keep their own references
+        load_image.cache_clear()
         self.callback(username)
 
     def _show_new_user_prompt(self):
         """Show prompt for first-time user"""
-        label = tk.Label(
+        self.welcome_label = tk.Label(
             self.frame,
             text="Welcome! Create your first user profile:",
-            font=("Helvetica", 16),
+            font=FONTS["subheader"],
             bg=COLORS['bg_dark'],
             fg=COLORS['text_light']
         )
-        label.pack(pady=20)
+        self.welcome_label.pack(pady=20)
 
         self._add_new_user()
 
     def _add_new_user(self):
         """Add a new user"""
-        dialog = tk.Toplevel(self.root)
-        dialog.title("Create New User")
-        dialog.geometry("400x200")
-        dialog.configure(bg=COLORS['bg_light'])
-        dialog.grab_set()
+        dialog = create_modal_window(self.root, "Create New User", 400, 200)
 
         # small header
         header_frame = tk.Frame(dialog, bg=COLORS['bg_medium'], height=50)
@@ -271,7 +524,7 @@ class UserSelectionScreen:
         tk.Label(
             header_frame,
             text="Create New Profile",
-            font=("Helvetica", 16, "bold"),
+            font=FONTS["subheader_bold"],
             bg=COLORS['bg_medium'],
             fg=COLORS['text_light']
         ).pack(pady=12)
@@ -279,15 +532,14 @@ class UserSelectionScreen:
         tk.Label(
             dialog,
             text="Enter username:",
-            font=("Helvetica", 12),
+            font=FONTS["label"],
             bg=COLORS['bg_light'],
             fg=COLORS['text_dark']
         ).pack(pady=20)
 
         username_var = tk.StringVar()
-        entry = tk.Entry(dialog, textvariable=username_var, font=("Helvetica", 12), width=25)
+        entry = tk.Entry(dialog, textvariable=username_var, font=FONTS["label"], width=25)
         entry.pack(pady=10)
-        entry.focus()
 
         def save_user():
             username = username_var.get().strip()
@@ -299,8 +551,7 @@ class UserSelectionScreen:
                 if self.user_manager.create_user(username):
                     messagebox.showinfo("Success", f"User '{username}' created successfully!")
                     dialog.destroy()
-                    self.frame.destroy()
-                    self.__init__(self.root, self.callback)
+                    self._refresh_users()
                 else:
                     messagebox.showerror("Error", "Username already exists!")
             except Exception as e:
@@ -311,87 +562,60 @@ class UserSelectionScreen:
             text="Create Profile",
             command=save_user,
             bg=COLORS['accent_green'],
-            fg="black",  # Black text for Mac
-            font=("Helvetica", 11, "bold"),
-            padx=20,
-            pady=8,
-            relief="flat",
-            cursor="hand2"
+            **BUTTON_STYLES["action"]
         ).pack(pady=15)
 
+        show_modal_window(dialog)
+        entry.focus()
+
 
 class DetailsWindow:
     """Window for displaying full media details"""
 
     def __init__(self, parent, media):
         """Initialize details window"""
-        self.window = tk.Toplevel(parent)
-        self.window.title(f"Details - {media.title}")
-        self.window.geometry("600x700")
-        self.window.configure(bg=COLORS['bg_light'])
-        self.window.grab_set()
-
+        self.window = create_modal_window(parent, f"Details - {media.title}", 600, 700)
         self._create_widgets(media)
+        show_modal_window(self.window)
+        after_first_paint(self.window, self._create_secondary_widgets, media)
 
     def _create_widgets(self, media):
-        """Create detail widgets"""
+        """Create the cover, title and detail rows shown when the window opens"""
         # Header
         header_frame = tk.Frame(self.window, bg=COLORS['bg_dark'], height=60)
         header_frame.pack(fill="x")
-        tk.Label(
+        ttk.Label(
             header_frame,
             text="Media Details",
-            font=("Helvetica", 18, "bold"),
-            bg=COLORS['bg_dark'],
-            fg=COLORS['text_light']
+            style="Header.TLabel"
         ).pack(pady=15)
 
         # Create scrollable frame
-        canvas = tk.Canvas(self.window, bg=COLORS['bg_light'])
-        scrollbar = ttk.Scrollbar(self.window, orient="vertical", command=canvas.yview)
-        main_frame = tk.Frame(canvas, bg=COLORS['bg_light'], padx=20, pady=20)
-
-        main_frame.bind(
-            "<Configure>",
-            lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
-        )
+        self.canvas = tk.Canvas(self.window, bg=COLORS['bg_light'])
+        scrollbar = ttk.Scrollbar(self.window, orient="vertical", command=self.canvas.yview)
+        self.main_frame = main_frame = tk.Frame(self.canvas, bg=COLORS['bg_light'], padx=20, pady=20)
 
-        canvas.create_window((0, 0), window=main_frame, anchor="nw")
-        canvas.configure(yscrollcommand=scrollbar.set)
+        self.canvas.create_window((0, 0), window=main_frame, anchor="nw")
+        self.canvas.configure(yscrollcommand=scrollbar.set)
 
-        canvas.pack(side="left", fill="both", expand=True)
+        self.canvas.pack(side="left", fill="both", expand=True)
         scrollbar.pack(side="right", fill="y")
 
-        # Load user-uploaded cover image or show placeholder
-        if media.image_path and os.path.exists(media.image_path):
-            try:
-                img = Image.open(media.image_path)
-                # Larger thumbnail size: 250x400 as this maintains portrait images better
-                img.thumbnail((250, 400))
-                photo = ImageTk.PhotoImage(img)
-                img_label = tk.Label(main_frame, image=photo, bg=COLORS['bg_light'])
-                img_label.image = photo
-                img_label.pack(pady=10)
-            except:
-                # Show placeholder if image fails to load
-                placeholder = load_image("placeholder.png", size=(250, 400))
-                if placeholder:
-                    img_label = tk.Label(main_frame, image=placeholder, bg=COLORS['bg_light'])
-                    img_label.image = placeholder
-                    img_label.pack(pady=10)
-        else:
-            # Show placeholder when no image path
-            placeholder = load_image("placeholder.png", size=(250, 400))
-            if placeholder:
-                img_label = tk.Label(main_frame, image=placeholder, bg=COLORS['bg_light'])
-                img_label.image = placeholder
-                img_label.pack(pady=10)
+        # Show the placeholder straight away; a user-uploaded cover replaces
+        # it once decoded on a loader thread
+        self.cover_label = tk.Label(main_frame, image=PLACEHOLDER_250x400 or "", bg=COLORS['bg_light'])
+        self.cover_label.pack(pady=10)
+
+        if media.image_path:
+            # Larger thumbnail size: 250x400 as this maintains portrait images better
+            future = _IMG_POOL.submit(_decode_cover, media.image_path, (250, 400))
+            self.window.after(COVER_POLL_MS, self._swap_cover, future)
 
         # Title
         tk.Label(
             main_frame,
             text=media.title,
-            font=("Helvetica", 20, "bold"),
+            font=FONTS["title"],
             bg=COLORS['bg_light'],
             fg=COLORS['text_dark'],
             wraplength=550
@@ -406,48 +630,49 @@ class DetailsWindow:
             ("Genre:", media.genre),
             ("Release Date:", media.release_date),
             ("Director/Author:", media.director),
-            ("Rating:", f"{media.rating}/10 {get_rating_symbol(media.rating)}" if media.rating else "-"),
+            ("Rating:", rating_cell(media.rating)),
             ("Status:", media.status),
             ("Date Added:", media.date_added.split()[0] if media.date_added else "-")
         ]
 
+        # One grid row per detail: label, optional icon, value
+        details_frame.columnconfigure(2, weight=1)
         for i, (label, value) in enumerate(details):
-            row_frame = tk.Frame(details_frame, bg="white")
-            row_frame.pack(fill="x", padx=15, pady=5)
-
-            tk.Label(
-                row_frame,
+            ttk.Label(
+                details_frame,
                 text=label,
-                font=("Helvetica", 11, "bold"),
-                bg="white",
-                fg=COLORS['text_dark'],
+                style="CardBold.TLabel",
                 anchor="w",
                 width=15
-            ).pack(side="left")
+            ).grid(row=i, column=0, sticky="w", padx=(15, 0), pady=5)
 
             # Add icon for Type field
             if i == 0 and label == "Type:":  # First item is Type
                 icon_img = get_media_icon(media.media_type)
                 if icon_img:
-                    icon_label = tk.Label(row_frame, image=icon_img, bg="white")
-                    icon_label.image = icon_img  # Keep reference
-                    icon_label.pack(side="left", padx=(0, 5))
+                    # MEDIA_ICONS keeps the icon alive, no per-widget reference needed
+                    icon_label = tk.Label(details_frame, image=icon_img, bg="white")
+                    icon_label.grid(row=i, column=1, padx=(0, 5), pady=5)
 
-            tk.Label(
-                row_frame,
+            ttk.Label(
+                details_frame,
                 text=value,
-                font=("Helvetica", 11),
-                bg="white",
-                fg=COLORS['text_dark'],
+                style="Card.TLabel",
                 anchor="w"
-            ).pack(side="left", fill="x", expand=True)
+            ).grid(row=i, column=2, sticky="we", padx=(0, 15), pady=5)
+
+    def _create_secondary_widgets(self, media):
+        """Create the description and Close button once the window is showing"""
+        if not self.window.winfo_exists():
+            return
+        main_frame = self.main_frame
 
         # Description section
         if media.description:
             tk.Label(
                 main_frame,
                 text="Description:",
-                font=("Helvetica", 12, "bold"),
+                font=FONTS["label_bold"],
                 bg=COLORS['bg_light'],
                 fg=COLORS['text_dark'],
                 anchor="w"
@@ -456,7 +681,7 @@ class DetailsWindow:
             desc_frame = tk.Frame(main_frame, bg="white", relief="solid", bd=1)
             desc_frame.pack(fill="both", expand=True)
 
-            desc_text = tk.Text(desc_frame, wrap="word", font=("Helvetica", 10),
+            desc_text = tk.Text(desc_frame, wrap="word", font=FONTS["body_small"],
                                 height=8, bg="white", fg="black")  # Black text for Mac
             desc_text.insert("1.0", media.description)
             desc_text.config(state="disabled")
@@ -468,14 +693,30 @@ class DetailsWindow:
             text="Close",
             command=self.window.destroy,
             bg=COLORS['accent_blue'],
-            fg="black",  # Black text for Mac
-            font=("Helvetica", 11, "bold"),
-            padx=30,
-            pady=8,
-            relief="flat",
-            cursor="hand2"
+            **BUTTON_STYLES["dialog"]
         ).pack(pady=15)
 
+        # Bound last so packing the children above doesn't re-run bbox each time
+        bind_scroll_region(self.canvas, main_frame)
+
+    def _swap_cover(self, future):
+        """Show the decoded cover once the loader thread has finished"""
+        if not self.window.winfo_exists():
+            return
+        if not future.done():
+            self.window.after(COVER_POLL_MS, self._swap_cover, future)
+            return
+
+        try:
+            img = future.result()
+        except Exception:
+            # Keep the placeholder if the image fails to load
+            return
+        # PhotoImage must be created on the Tk thread
+        photo = ImageTk.PhotoImage(img)
+        self.cover_label.configure(image=photo)
+        self.cover_label.image = photo
+
 
 class AddEditWindow:
     """Window for adding or editing media items"""
@@ -485,11 +726,7 @@ class AddEditWindow:
         self.media = media
         self.callback = callback
 
-        self.window = tk.Toplevel(parent)
-        self.window.title("Edit Media" if media else "Add New Media")
-        self.window.geometry("700x750")
-        self.window.configure(bg=COLORS['bg_light'])
-        self.window.grab_set()
+        self.window = create_modal_window(parent, "Edit Media" if media else "Add New Media", 700, 750)
 
         self.image_path = media.image_path if media else ""
 
@@ -498,34 +735,30 @@ class AddEditWindow:
         if media:
             self._populate_fields()
 
+        show_modal_window(self.window)
+        after_first_paint(self.window, self._create_secondary_widgets)
+
     def _create_widgets(self):
-        """Create form widgets"""
+        """Create the header and the short form fields shown when the window opens"""
         # Header
         header_frame = tk.Frame(self.window, bg=COLORS['bg_dark'], height=60)
         header_frame.pack(fill="x")
         title_text = "Edit Media Item" if self.media else "Add New Media Item"
-        tk.Label(
+        ttk.Label(
             header_frame,
             text=title_text,
-            font=("Helvetica", 18, "bold"),
-            bg=COLORS['bg_dark'],
-            fg=COLORS['text_light']
+            style="Header.TLabel"
         ).pack(pady=15)
 
         # Scrollable form
-        canvas = tk.Canvas(self.window, bg=COLORS['bg_light'])
-        scrollbar = ttk.Scrollbar(self.window, orient="vertical", command=canvas.yview)
-        self.form_frame = tk.Frame(canvas, bg=COLORS['bg_light'])
+        self.canvas = tk.Canvas(self.window, bg=COLORS['bg_light'])
+        scrollbar = ttk.Scrollbar(self.window, orient="vertical", command=self.canvas.yview)
+        self.form_frame = tk.Frame(self.canvas, bg=COLORS['bg_light'])
 
-        self.form_frame.bind(
-            "<Configure>",
-            lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
-        )
-
-        canvas.create_window((0, 0), window=self.form_frame, anchor="nw")
-        canvas.configure(yscrollcommand=scrollbar.set)
+        self.canvas.create_window((0, 0), window=self.form_frame, anchor="nw")
+        self.canvas.configure(yscrollcommand=scrollbar.set)
 
-        canvas.pack(side="left", fill="both", expand=True, padx=20, pady=10)
+        self.canvas.pack(side="left", fill="both", expand=True, padx=20, pady=10)
         scrollbar.pack(side="right", fill="y")
 
         # Form fields
@@ -544,12 +777,10 @@ class AddEditWindow:
         date_frame = tk.Frame(self.form_frame, bg=COLORS['bg_light'])
         date_frame.pack(fill="x", pady=5)
 
-        tk.Label(
+        ttk.Label(
             date_frame,
             text="Release Date:",
-            font=("Helvetica", 11),
-            bg=COLORS['bg_light'],
-            fg=COLORS['text_dark'],
+            style="Field.TLabel",
             anchor="w"
         ).pack(side="left", padx=(0, 10))
 
@@ -571,47 +802,46 @@ class AddEditWindow:
         rating_frame = tk.Frame(self.form_frame, bg=COLORS['bg_light'])
         rating_frame.pack(fill="x", pady=5)
 
-        tk.Label(
+        ttk.Label(
             rating_frame,
             text="Rating (0-10):",
-            font=("Helvetica", 11),
-            bg=COLORS['bg_light'],
-            fg=COLORS['text_dark'],
+            style="Field.TLabel",
             anchor="w"
         ).pack(side="left", padx=(0, 10))
 
         self.rating_var = tk.StringVar()
-        rating_spinbox = tk.Spinbox(
+        rating_combo = ttk.Combobox(
             rating_frame,
-            from_=0,
-            to=10,
-            increment=0.5,
             textvariable=self.rating_var,
-            font=("Helvetica", 10),
-            width=10
+            values=RATING_VALUES,
+            state="readonly",
+            width=6
         )
-        rating_spinbox.pack(side="left")
+        rating_combo.pack(side="left")
 
         # Status
         self._create_field("Status *", "status", ttk.Combobox, values=STATUSES)
 
+    def _create_secondary_widgets(self):
+        """Create the description box, cover picker and buttons once the window is showing"""
+        if not self.window.winfo_exists():
+            return
+
         # Description
         desc_label_frame = tk.Frame(self.form_frame, bg=COLORS['bg_light'])
         desc_label_frame.pack(fill="x", pady=(10, 5))
 
-        tk.Label(
+        ttk.Label(
             desc_label_frame,
             text="Description:",
-            font=("Helvetica", 11),
-            bg=COLORS['bg_light'],
-            fg=COLORS['text_dark'],
+            style="Field.TLabel",
             anchor="w"
         ).pack(side="left")
 
         self.description_text = tk.Text(
             self.form_frame,
             height=5,
-            font=("Helvetica", 10),
+            font=FONTS["body_small"],
             wrap="word",
             bg="white",
             fg="black",  # Black text for Mac
@@ -630,18 +860,13 @@ class AddEditWindow:
             text="Choose Cover Image",
             command=self._choose_image,
             bg=COLORS['accent_orange'],
-            fg="black",  # Black text for Mac
-            font=("Helvetica", 10, "bold"),
-            padx=15,
-            pady=5,
-            relief="flat",
-            cursor="hand2"
+            **BUTTON_STYLES["small"]
         ).pack(side="left", padx=5)
 
         self.image_label = tk.Label(
             image_frame,
             text="No image selected",
-            font=("Helvetica", 9),
+            font=FONTS["small"],
             bg=COLORS['bg_light'],
             fg=COLORS['text_dark']
         )
@@ -656,12 +881,7 @@ class AddEditWindow:
             text="Save",
             command=self._save,
             bg=COLORS['accent_green'],
-            fg="black",  # Black text for Mac
-            font=("Helvetica", 12, "bold"),
-            padx=40,
-            pady=10,
-            relief="flat",
-            cursor="hand2"
+            **BUTTON_STYLES["form"]
         ).pack(side="left", padx=10)
 
         tk.Button(
@@ -669,25 +889,26 @@ class AddEditWindow:
             text="Cancel",
             command=self.window.destroy,
             bg=COLORS['accent_red'],
-            fg="black",  # Black text for Mac
-            font=("Helvetica", 12, "bold"),
-            padx=40,
-            pady=10,
-            relief="flat",
-            cursor="hand2"
+            **BUTTON_STYLES["form"]
         ).pack(side="left", padx=10)
 
+        if self.media:
+            if self.media.description:
+                self.description_text.insert("1.0", self.media.description)
+            if self.media.image_path:
+                self.image_label.config(text=os.path.basename(self.media.image_path))
+
+        bind_scroll_region(self.canvas, self.form_frame)
+
     def _create_field(self, label_text, field_name, widget_class, **kwargs):
         """Create a form field"""
         frame = tk.Frame(self.form_frame, bg=COLORS['bg_light'])
         frame.pack(fill="x", pady=5)
 
-        tk.Label(
+        ttk.Label(
             frame,
             text=label_text,
-            font=("Helvetica", 11),
-            bg=COLORS['bg_light'],
-            fg=COLORS['text_dark'],
+            style="Field.TLabel",
             anchor="w",
             width=15
         ).pack(side="left", padx=(0, 10))
@@ -695,7 +916,7 @@ class AddEditWindow:
         if widget_class == ttk.Combobox:
             widget = ttk.Combobox(frame, state="readonly", **kwargs)
         else:
-            widget = widget_class(frame, font=("Helvetica", 10), **kwargs)
+            widget = widget_class(frame, font=FONTS["body_small"], **kwargs)
 
         widget.pack(side="left", fill="x", expand=True)
         self.entries[field_name] = widget
@@ -711,7 +932,7 @@ class AddEditWindow:
             self.image_label.config(text=os.path.basename(filename))
 
     def _populate_fields(self):
-        """Populate fields with existing media data"""
+        """Populate the first-shown fields with existing media data"""
         if not self.media:
             return
 
@@ -719,26 +940,21 @@ class AddEditWindow:
         self.entries['media_type'].set(self.media.media_type)
         self.entries['genre'].set(self.media.genre)
 
-        if self.media.release_date:
-            parts = self.media.release_date.split()
-            if len(parts) >= 3:
-                self.month_var.set(parts[0])
-                self.day_var.set(parts[1].rstrip(','))
-                self.year_var.set(parts[2])
+        release = parse_release_date(self.media.release_date)
+        if release:
+            month, day, year = release
+            self.month_var.set(month)
+            self.day_var.set(day)
+            self.year_var.set(year)
 
         self.entries['director'].insert(0, self.media.director)
 
         if self.media.rating:
+            # Shown unchanged so ratings between the half points survive an edit
             self.rating_var.set(str(self.media.rating))
 
         self.entries['status'].set(self.media.status)
 
-        if self.media.description:
-            self.description_text.insert("1.0", self.media.description)
-
-        if self.media.image_path:
-            self.image_label.config(text=os.path.basename(self.media.image_path))
-
     def _save(self):
         """Save media item"""
         # Validate required fields
@@ -755,18 +971,9 @@ class AddEditWindow:
         if self.month_var.get() and self.day_var.get() and self.year_var.get():
             release_date = f"{self.month_var.get()} {self.day_var.get()}, {self.year_var.get()}"
 
-        # Get rating
-        rating = None
-        try:
-            rating_text = self.rating_var.get()
-            if rating_text:
-                rating = float(rating_text)
-                if not (0 <= rating <= 10):
-                    messagebox.showerror("Error", "Rating must be between 0 and 10")
-                    return
-        except ValueError:
-            messagebox.showerror("Error", "Invalid rating value")
-            return
+        # Get rating; the readonly combobox only holds "" or a valid rating
+        rating_text = self.rating_var.get()
+        rating = float(rating_text) if rating_text else None
 
         # Create media object
         media = Media(
@@ -787,179 +994,202 @@ class AddEditWindow:
 
 
 class StatisticsWindow:
-    """Window for displaying library statistics"""
+    """Window for displaying library statistics, built once and hidden on close"""
 
     def __init__(self, parent, db_model):
         """Initialize statistics window"""
-        self.window = tk.Toplevel(parent)
-        self.window.title(f"{APP_NAME} - Statistics")
-        self.window.geometry("700x600")
-        self.window.configure(bg=COLORS['bg_light'])
-        self.window.grab_set()
+        self.window = create_modal_window(parent, f"{APP_NAME} - Statistics", 700, 600)
+        self.window.protocol("WM_DELETE_WINDOW", self.hide)
 
         self.db_model = db_model
+        self.total_var = tk.StringVar()
+        self.average_var = tk.StringVar()
+        self.error_var = tk.StringVar()
+        # Breakdown rows by category, created the first time a category appears
+        self._type_rows = {}
+        self._status_rows = {}
+        # Statistics currently shown; get_statistics returns this same dict
+        # until the library changes
+        self._shown_stats = None
         self._create_widgets()
 
+        self.show()
+
+    def show(self):
+        """Refresh the statistics and show the window"""
+        self.refresh()
+        show_modal_window(self.window)
+
+    def hide(self):
+        """Hide the window so the next show() can reuse it"""
+        self.window.grab_release()
+        self.window.withdraw()
+
     def _create_widgets(self):
         """Create statistics widgets"""
         # Header
         header_frame = tk.Frame(self.window, bg=COLORS['bg_dark'], height=60)
         header_frame.pack(fill="x")
-        tk.Label(
+        ttk.Label(
             header_frame,
             text="Library Statistics",
-            font=("Helvetica", 18, "bold"),
-            bg=COLORS['bg_dark'],
-            fg=COLORS['text_light']
+            style="Header.TLabel"
         ).pack(pady=15)
 
         main_frame = tk.Frame(self.window, bg=COLORS['bg_light'], padx=30, pady=20)
         main_frame.pack(fill="both", expand=True)
 
-        try:
-            stats = self.db_model.get_statistics()
+        self.content_frame = tk.Frame(main_frame, bg=COLORS['bg_light'])
 
-            # Total items with large display
-            total_frame = tk.Frame(main_frame, bg=COLORS['accent_blue'], relief="solid", bd=2)
-            total_frame.pack(fill="x", pady=15)
+        # Total items with large display
+        total_frame = tk.Frame(self.content_frame, bg=COLORS['accent_blue'], relief="solid", bd=2)
+        total_frame.pack(fill="x", pady=15)
 
-            tk.Label(
-                total_frame,
-                text=str(stats['total_items']),
-                font=("Helvetica", 48, "bold"),
-                bg=COLORS['accent_blue'],
-                fg="black"
-            ).pack(pady=10)
+        tk.Label(
+            total_frame,
+            textvariable=self.total_var,
+            font=FONTS["stat_total"],
+            bg=COLORS['accent_blue'],
+            fg="black"
+        ).pack(pady=10)
 
-            tk.Label(
-                total_frame,
-                text="Total Items in Library",
-                font=("Helvetica", 14),
-                bg=COLORS['accent_blue'],
-                fg="black"
-            ).pack(pady=(0, 10))
-
-            # Decorative separator
-            create_decorative_separator(main_frame, width=640).pack(pady=15)
-
-            # Type breakdown
-            if stats['type_breakdown']:
-                tk.Label(
-                    main_frame,
-                    text="📚 By Media Type",
-                    font=("Helvetica", 16, "bold"),
-                    bg=COLORS['bg_light'],
-                    fg=COLORS['text_dark'],
-                    anchor="w"
-                ).pack(fill="x", pady=(10, 5))
-
-                type_frame = tk.Frame(main_frame, bg="white", relief="solid", bd=1)
-                type_frame.pack(fill="x", pady=5)
-
-                for media_type, count in sorted(stats['type_breakdown'].items()):
-                    row = tk.Frame(type_frame, bg="white")
-                    row.pack(fill="x", padx=15, pady=5)
-
-                    tk.Label(
-                        row,
-                        text=media_type,
-                        font=("Helvetica", 11),
-                        bg="white",
-                        fg=COLORS['text_dark'],
-                        anchor="w",
-                        width=20
-                    ).pack(side="left")
-
-                    tk.Label(
-                        row,
-                        text=str(count),
-                        font=("Helvetica", 11, "bold"),
-                        bg="white",
-                        fg=COLORS['accent_blue'],
-                        anchor="e"
-                    ).pack(side="right")
-
-            # Status breakdown
-            if stats['status_breakdown']:
-                tk.Label(
-                    main_frame,
-                    text="📊 By Status",
-                    font=("Helvetica", 16, "bold"),
-                    bg=COLORS['bg_light'],
-                    fg=COLORS['text_dark'],
-                    anchor="w"
-                ).pack(fill="x", pady=(15, 5))
-
-                status_frame = tk.Frame(main_frame, bg="white", relief="solid", bd=1)
-                status_frame.pack(fill="x", pady=5)
-
-                for status, count in sorted(stats['status_breakdown'].items()):
-                    row = tk.Frame(status_frame, bg="white")
-                    row.pack(fill="x", padx=15, pady=5)
-
-                    tk.Label(
-                        row,
-                        text=status,
-                        font=("Helvetica", 11),
-                        bg="white",
-                        fg=COLORS['text_dark'],
-                        anchor="w",
-                        width=20
-                    ).pack(side="left")
-
-                    tk.Label(
-                        row,
-                        text=str(count),
-                        font=("Helvetica", 11, "bold"),
-                        bg="white",
-                        fg=COLORS['accent_green'],
-                        anchor="e"
-                    ).pack(side="right")
-
-            # Average rating
-            tk.Label(
-                main_frame,
-                text="⭐ Average Rating",
-                font=("Helvetica", 16, "bold"),
-                bg=COLORS['bg_light'],
-                fg=COLORS['text_dark'],
-                anchor="w"
-            ).pack(fill="x", pady=(15, 5))
+        tk.Label(
+            total_frame,
+            text="Total Items in Library",
+            font=FONTS["large"],
+            bg=COLORS['accent_blue'],
+            fg="black"
+        ).pack(pady=(0, 10))
+
+        # Decorative separator
+        create_decorative_separator(self.content_frame, width=640).pack(pady=15)
+
+        # Type breakdown
+        self.type_section = tk.Frame(self.content_frame, bg=COLORS['bg_light'])
+        self.type_section.pack(fill="x")
+        ttk.Label(
+            self.type_section,
+            text="📚 By Media Type",
+            style="Section.TLabel",
+            anchor="w"
+        ).pack(fill="x", pady=(10, 5))
+
+        self.type_frame = tk.Frame(self.type_section, bg="white", relief="solid", bd=1)
+        self.type_frame.pack(fill="x", pady=5)
+
+        # Status breakdown
+        self.status_section = tk.Frame(self.content_frame, bg=COLORS['bg_light'])
+        self.status_section.pack(fill="x")
+        ttk.Label(
+            self.status_section,
+            text="📊 By Status",
+            style="Section.TLabel",
+            anchor="w"
+        ).pack(fill="x", pady=(15, 5))
 
-            rating_frame = tk.Frame(main_frame, bg=COLORS['accent_purple'], relief="solid", bd=2)
-            rating_frame.pack(fill="x", pady=5)
+        self.status_frame = tk.Frame(self.status_section, bg="white", relief="solid", bd=1)
+        self.status_frame.pack(fill="x", pady=5)
 
-            avg_rating = stats.get('average_rating', 0)
-            tk.Label(
-                rating_frame,
-                text=f"{avg_rating}/10",
-                font=("Helvetica", 24, "bold"),
-                bg=COLORS['accent_purple'],
-                fg="black"
-            ).pack(pady=15)
+        # Average rating
+        self.rating_heading = ttk.Label(
+            self.content_frame,
+            text="⭐ Average Rating",
+            style="Section.TLabel",
+            anchor="w"
+        )
+        self.rating_heading.pack(fill="x", pady=(15, 5))
 
-        except Exception as e:
-            tk.Label(
-                main_frame,
-                text=f"Error loading statistics: {e}",
-                font=("Helvetica", 12),
-                bg=COLORS['bg_light'],
-                fg=COLORS['accent_red']
-            ).pack(pady=20)
+        rating_frame = tk.Frame(self.content_frame, bg=COLORS['accent_purple'], relief="solid", bd=2)
+        rating_frame.pack(fill="x", pady=5)
+
+        tk.Label(
+            rating_frame,
+            textvariable=self.average_var,
+            font=FONTS["stat_value"],
+            bg=COLORS['accent_purple'],
+            fg="black"
+        ).pack(pady=15)
+
+        self.error_label = tk.Label(
+            main_frame,
+            textvariable=self.error_var,
+            font=FONTS["label"],
+            bg=COLORS['bg_light'],
+            fg=COLORS['accent_red']
+        )
 
         # Close button
-        tk.Button(
+        self.close_button = tk.Button(
             main_frame,
             text="Close",
-            command=self.window.destroy,
+            command=self.hide,
             bg=COLORS['accent_blue'],
-            fg="black",  # Black text for Mac
-            font=("Helvetica", 11, "bold"),
-            padx=30,
-            pady=8,
-            relief="flat",
-            cursor="hand2"
-        ).pack(pady=20)
+            **BUTTON_STYLES["dialog"]
+        )
+        self.close_button.pack(pady=20)
+
+    def refresh(self):
+        """Update the existing widgets with the current statistics"""
+        try:
+            stats = self.db_model.get_statistics()
+        except Exception as e:
+            self._shown_stats = None
+            self.content_frame.pack_forget()
+            self.error_var.set(f"Error loading statistics: {e}")
+            self.error_label.pack(pady=20, before=self.close_button)
+            return
+
+        if stats is self._shown_stats:
+            return
+        self._shown_stats = stats
+
+        self.error_label.pack_forget()
+        self.content_frame.pack(fill="x", before=self.close_button)
+
+        self.total_var.set(str(stats['total_items']))
+        self._update_breakdown(self.type_section, self.type_frame, self._type_rows,
+                               stats['type_breakdown'], COLORS['accent_blue'])
+        self._update_breakdown(self.status_section, self.status_frame, self._status_rows,
+                               stats['status_breakdown'], COLORS['accent_green'])
+        self.average_var.set(f"{stats.get('average_rating', 0)}/10")
+
+    def _update_breakdown(self, section, frame, rows, breakdown, color):
+        """Show one row per category in breakdown, reusing rows from earlier refreshes"""
+        for row, _ in rows.values():
+            row.pack_forget()
+
+        if not breakdown:
+            section.pack_forget()
+            return
+        section.pack(fill="x", before=self.rating_heading)
+
+        for name, count in breakdown.items():
+            if name not in rows:
+                row = tk.Frame(frame, bg="white")
+                count_var = tk.StringVar()
+
+                ttk.Label(
+                    row,
+                    text=name,
+                    style="Card.TLabel",
+                    anchor="w",
+                    width=20
+                ).pack(side="left")
+
+                tk.Label(
+                    row,
+                    textvariable=count_var,
+                    font=FONTS["body_bold"],
+                    bg="white",
+                    fg=color,
+                    anchor="e"
+                ).pack(side="right")
+
+                rows[name] = (row, count_var)
+
+            row, count_var = rows[name]
+            count_var.set(str(count))
+            row.pack(fill="x", padx=15, pady=5)
 
 
 class MainApplication:
@@ -978,6 +1208,19 @@ class MainApplication:
 
         self.current_media_list = []
         self.sort_reverse = {}
+        # (column, reverse) of the last heading sort, kept across refreshes
+        self._active_sort = None
+        self._filter_job = None
+        # Pending worker reads; a load and a filter are tracked separately so
+        # a filter started during a load doesn't drop the load's rows
+        self._load_future = None
+        self._filter_future = None
+        self._stats_window = None
+
+        # Treeview rows are kept (attached or detached) per media id, along
+        # with the values they show, so refreshes only touch what changed
+        self._iid_by_id = {}
+        self._values_by_id = {}
 
         self._setup_styles()
         self._create_menu()
@@ -995,17 +1238,16 @@ class MainApplication:
                         background="white",
                         foreground="black",  # Black text for visibility
                         fieldbackground="white",
-                        font=("Helvetica", 10))
+                        font=FONTS["body_small"])
         style.configure("Treeview.Heading",
-                        font=("Helvetica", 10, "bold"),
+                        font=FONTS["body_small_bold"],
                         foreground="black")  # Black heading text
 
         style.map('Treeview',
                   background=[('selected', 'focus', COLORS['accent_blue']),
                               ('selected', '!focus', '#d3d3d3')],  # Light gray when unfocused
                   foreground=[('selected', 'focus', 'white'),  # White text on blue when focused
-                              ('selected', '!focus', 'black'),  # Black text on gray when unfocused
-                              ('!selected', 'black')])  # Black text when not selected
+                              ('selected', '!focus', 'black')])  # Black text on gray when unfocused
 
     def _create_menu(self):
         """Create menu bar"""
@@ -1036,7 +1278,7 @@ class MainApplication:
         tk.Label(
             welcome_frame,
             text=f"Welcome back, {self.username}!",
-            font=("Helvetica", 14),
+            font=FONTS["large"],
             bg=COLORS['bg_light'],
             fg=COLORS['text_dark']
         ).pack(side="left")
@@ -1049,13 +1291,13 @@ class MainApplication:
         tk.Label(
             control_frame,
             text="🔍 Search:",
-            font=("Helvetica", 10),
+            font=FONTS["body_small"],
             bg=COLORS['bg_light'],
             fg=COLORS['text_dark']
         ).pack(side="left", padx=5)
 
         self.search_var = tk.StringVar()
-        self.search_var.trace("w", lambda *args: self._apply_filters())
+        self.search_var.trace_add("write", self._schedule_filter)
         search_entry = ttk.Entry(control_frame, textvariable=self.search_var, width=20)
         search_entry.pack(side="left", padx=5)
 
@@ -1063,31 +1305,31 @@ class MainApplication:
         tk.Label(
             control_frame,
             text="📁 Type:",
-            font=("Helvetica", 10),
+            font=FONTS["body_small"],
             bg=COLORS['bg_light'],
             fg=COLORS['text_dark']
         ).pack(side="left", padx=(15, 5))
 
         self.filter_type_var = tk.StringVar(value="All")
         type_combo = ttk.Combobox(control_frame, textvariable=self.filter_type_var,
-                                  values=["All"] + MEDIA_TYPES, state="readonly", width=15)
+                                  values=FILTER_MEDIA_TYPES, state="readonly", width=15)
         type_combo.pack(side="left", padx=5)
-        type_combo.bind("<<ComboboxSelected>>", lambda e: self._apply_filters())
+        type_combo.bind("<<ComboboxSelected>>", self._apply_filters)
 
         # Filter by Status
         tk.Label(
             control_frame,
             text="⏳ Status:",
-            font=("Helvetica", 10),
+            font=FONTS["body_small"],
             bg=COLORS['bg_light'],
             fg=COLORS['text_dark']
         ).pack(side="left", padx=(15, 5))
 
         self.filter_status_var = tk.StringVar(value="All")
         status_combo = ttk.Combobox(control_frame, textvariable=self.filter_status_var,
-                                    values=["All"] + STATUSES, state="readonly", width=15)
+                                    values=FILTER_STATUSES, state="readonly", width=15)
         status_combo.pack(side="left", padx=5)
-        status_combo.bind("<<ComboboxSelected>>", lambda e: self._apply_filters())
+        status_combo.bind("<<ComboboxSelected>>", self._apply_filters)
 
         # Treeview
         tree_frame = tk.Frame(self.root, bg=COLORS['bg_light'])
@@ -1117,8 +1359,13 @@ class MainApplication:
         tree_frame.grid_rowconfigure(0, weight=1)
         tree_frame.grid_columnconfigure(0, weight=1)
 
+        for status, tag in STATUS_TAGS.items():
+            self.treeview.tag_configure(tag, foreground=STATUS_COLORS[status])
+        for media_type, tag in MEDIA_TYPE_TAGS.items():
+            self.treeview.tag_configure(tag, background=MEDIA_TYPE_COLORS[media_type])
+
         self.treeview.bind("<<TreeviewSelect>>", self._on_select)
-        self.treeview.bind("<Double-1>", lambda e: self._show_details())
+        self.treeview.bind("<Double-1>", self._show_details)
 
         # Button panel
         button_frame = tk.Frame(self.root, bg=COLORS['bg_light'], pady=10)
@@ -1129,12 +1376,7 @@ class MainApplication:
             text="➕ Add New",
             command=self._add_media,
             bg=COLORS['accent_green'],
-            fg="black",  # Black text for Mac
-            font=("Helvetica", 11, "bold"),
-            padx=20,
-            pady=8,
-            relief="flat",
-            cursor="hand2"
+            **BUTTON_STYLES["action"]
         ).pack(side="left", padx=5)
 
         tk.Button(
@@ -1142,12 +1384,7 @@ class MainApplication:
             text="✏️ Edit",
             command=self._edit_media,
             bg=COLORS['accent_blue'],
-            fg="black",  # Black text for Mac
-            font=("Helvetica", 11, "bold"),
-            padx=20,
-            pady=8,
-            relief="flat",
-            cursor="hand2"
+            **BUTTON_STYLES["action"]
         ).pack(side="left", padx=5)
 
         tk.Button(
@@ -1155,12 +1392,7 @@ class MainApplication:
             text="🗑️ Delete",
             command=self._delete_media,
             bg=COLORS['accent_red'],
-            fg="black",  # Black text for Mac
-            font=("Helvetica", 11, "bold"),
-            padx=20,
-            pady=8,
-            relief="flat",
-            cursor="hand2"
+            **BUTTON_STYLES["action"]
         ).pack(side="left", padx=5)
 
         tk.Button(
@@ -1168,12 +1400,7 @@ class MainApplication:
             text="📊 Statistics",
             command=self._show_statistics,
             bg=COLORS['accent_purple'],
-            fg="black",  # Black text for Mac
-            font=("Helvetica", 11, "bold"),
-            padx=20,
-            pady=8,
-            relief="flat",
-            cursor="hand2"
+            **BUTTON_STYLES["action"]
         ).pack(side="left", padx=5)
 
         tk.Button(
@@ -1181,12 +1408,7 @@ class MainApplication:
             text="👁️ View Details",
             command=self._show_details,
             bg=COLORS['accent_orange'],
-            fg="black",  # Black text for Mac
-            font=("Helvetica", 11, "bold"),
-            padx=20,
-            pady=8,
-            relief="flat",
-            cursor="hand2"
+            **BUTTON_STYLES["action"]
         ).pack(side="left", padx=5)
 
         # Status bar
@@ -1197,44 +1419,110 @@ class MainApplication:
             relief="sunken",
             bg=COLORS['bg_medium'],
             fg=COLORS['text_light'],
-            font=("Helvetica", 9),
+            font=FONTS["small"],
             anchor="w"
         )
         status_bar.pack(fill="x")
 
     def _load_media(self):
-        """Load all media items from database"""
+        """Load all media items from database on a worker thread"""
+        self.status_var.set("Loading...")
+        # The load re-applies any active filter, so a filter read still pending is dropped
+        self._filter_future = None
+        # Plain row tuples; the full Media is fetched when an item is opened
+        self._load_future = self._read_in_background(self._apply_loaded, self.db_model.get_all_rows)
+
+    def _read_in_background(self, on_done, read, **kwargs):
+        """Run a database read on the worker thread, returning its future; on_done gets the rows"""
+        future = _DB_POOL.submit(read, **kwargs)
+        self.root.after(LOAD_POLL_MS, self._finish_read, future, on_done)
+        return future
+
+    def _finish_read(self, future, on_done):
+        """Hand a read's rows to its callback once the worker has finished"""
+        if future is not self._load_future and future is not self._filter_future:
+            # Superseded by a newer read of the same kind, or by a load
+            return
+        if not future.done():
+            self.root.after(LOAD_POLL_MS, self._finish_read, future, on_done)
+            return
+
+        if future is self._load_future:
+            self._load_future = None
+        else:
+            self._filter_future = None
         try:
-            self.current_media_list = self.db_model.get_all_records()
-            self._refresh_treeview(self.current_media_list)
-            self.status_var.set(f"Loaded {len(self.current_media_list)} items")
+            on_done(future.result())
         except Exception as e:
             messagebox.showerror("Error", f"Failed to load media: {e}")
 
-    def _refresh_treeview(self, media_list):
-        """Refresh treeview with media items"""
-        for item in self.treeview.get_children():
-            self.treeview.delete(item)
-
-        for media in media_list:
-            # Parse year from release_date
-            year = "-"
-            if media.release_date:
-                parts = media.release_date.split()
-                if parts and len(parts) >= 3:
-                    year = parts[-1]
-
-            values = (
-                media.id,
-                media.title,
-                media.media_type,
-                media.genre,
-                year,
-                media.director,
-                f"{media.rating}/10 {get_rating_symbol(media.rating)}" if media.rating else "-",
-                media.status
-            )
-            self.treeview.insert("", "end", values=values)
+    def _apply_loaded(self, rows):
+        """Replace the library contents with freshly loaded rows"""
+        self.current_media_list = rows
+        self._prune_treeview({row[0] for row in rows})
+        if self._filters_active():
+            # Showing every row would drop the search or filter still set in the controls
+            self._apply_filters()
+            return
+        self._refresh_treeview(self._in_sort_order(rows))
+        self.status_var.set(f"Loaded {len(rows)} items")
+
+    def _refresh_treeview(self, rows):
+        """Show exactly rows in the treeview, in order, changing only rows that differ"""
+        treeview = self.treeview
+        target_ids = {row[0] for row in rows}
+
+        # Hide rows that no longer match; they stay in the tree for reuse
+        hidden = [iid for iid in treeview.get_children() if int(iid) not in target_ids]
+        if hidden:
+            treeview.detach(*hidden)
+
+        order = list(treeview.get_children())
+        for index, row in enumerate(rows):
+            media_id = row[0]
+            values = self._treeview_values(row)
+            iid = self._iid_by_id.get(media_id)
+
+            if iid is None:
+                iid = treeview.insert("", index, iid=str(media_id), values=values,
+                                      tags=ROW_TAGS.get((row[7], row[2]), ()))
+                self._iid_by_id[media_id] = iid
+                self._values_by_id[media_id] = values
+                order.insert(index, iid)
+                continue
+
+            if self._values_by_id[media_id] != values:
+                treeview.item(iid, values=values, tags=ROW_TAGS.get((row[7], row[2]), ()))
+                self._values_by_id[media_id] = values
+
+            # Move only rows that are hidden or out of place
+            if index >= len(order) or order[index] != iid:
+                treeview.move(iid, "", index)
+                if iid in order:
+                    order.remove(iid)
+                order.insert(index, iid)
+
+    def _prune_treeview(self, existing_ids):
+        """Delete rows for media items that no longer exist"""
+        stale_ids = [media_id for media_id in self._iid_by_id if media_id not in existing_ids]
+        if stale_ids:
+            self.treeview.delete(*(self._iid_by_id.pop(media_id) for media_id in stale_ids))
+            for media_id in stale_ids:
+                del self._values_by_id[media_id]
+
+    def _treeview_values(self, row):
+        """Build the column values shown for a get_all_rows row"""
+        media_id, title, media_type, genre, release_year, director, rating, status = row
+        return (
+            media_id,
+            title,
+            media_type,
+            genre,
+            release_year or "-",
+            director,
+            rating_cell(rating),
+            status
+        )
 
     def _on_select(self, event):
         """Handle treeview selection"""
@@ -1244,7 +1532,7 @@ class MainApplication:
             values = item['values']
             self.status_var.set(f"Selected: {values[1]}")
 
-    def _show_details(self):
+    def _show_details(self, event=None):
         """Show detailed view of selected item"""
         selection = self.treeview.selection()
         if not selection:
@@ -1311,44 +1599,100 @@ class MainApplication:
             except Exception as e:
                 messagebox.showerror("Error", f"Failed to delete media: {e}")
 
-    def _apply_filters(self):
+    def _schedule_filter(self, *args):
+        """Apply filters once typing pauses instead of on every keystroke"""
+        if self._filter_job:
+            self.root.after_cancel(self._filter_job)
+        self._filter_job = self.root.after(FILTER_DEBOUNCE_MS, self._apply_filters)
+
+    def _apply_filters(self, event=None):
         """Apply search and filter criteria"""
-        search_term = self.search_var.get().strip().lower()
+        # Called directly by the comboboxes too, so drop any pending debounced run
+        if self._filter_job:
+            self.root.after_cancel(self._filter_job)
+            self._filter_job = None
+        if not self._filters_active():
+            # A search still running would otherwise replace the full list
+            self._filter_future = None
+            self._show_filtered(self.current_media_list)
+            return
+
         filter_type = self.filter_type_var.get()
         filter_status = self.filter_status_var.get()
+        # The filters run in SQL, where the type and status indexes apply
+        self._filter_future = self._read_in_background(
+            self._show_filtered,
+            self.db_model.search_rows,
+            title=self.search_var.get().strip() or None,
+            media_type=None if filter_type == "All" else filter_type,
+            status=None if filter_status == "All" else filter_status
+        )
 
-        filtered_list = self.current_media_list
-
-        if search_term:
-            filtered_list = [m for m in filtered_list if search_term in m.title.lower()]
-
-        if filter_type != "All":
-            filtered_list = [m for m in filtered_list if m.media_type == filter_type]
-
-        if filter_status != "All":
-            filtered_list = [m for m in filtered_list if m.status == filter_status]
+    def _filters_active(self):
+        """Return True if the search text, type or status filter is set"""
+        return bool(self.search_var.get().strip() or self.filter_type_var.get() != "All"
+                    or self.filter_status_var.get() != "All")
 
-        self._refresh_treeview(filtered_list)
-        self.status_var.set(f"Showing {len(filtered_list)} of {len(self.current_media_list)} items")
+    def _show_filtered(self, rows):
+        """Show the rows that passed the filters"""
+        self._refresh_treeview(self._in_sort_order(rows))
+        self.status_var.set(f"Showing {len(rows)} of {len(self.current_media_list)} items")
 
     def _clear_filters(self):
         """Clear all filters"""
         self.search_var.set("")
         self.filter_type_var.set("All")
         self.filter_status_var.set("All")
+        # _load_media shows every item, so the run queued by clearing the search is redundant
+        if self._filter_job:
+            self.root.after_cancel(self._filter_job)
+            self._filter_job = None
         self._load_media()
 
     def _sort_column(self, col):
-        """Sort treeview by column"""
-        pass
+        """Sort the shown rows by a column, reversing the order on each click"""
+        reverse = self.sort_reverse.get(col, False)
+        self.sort_reverse[col] = not reverse
+        self._active_sort = (col, reverse)
+
+        # Keys come from the values already kept per row, so nothing is read
+        # back from Tk; rows are then moved into place, not re-inserted
+        key = self._sort_key()
+        values_by_id = self._values_by_id
+        ordered = sorted(
+            self.treeview.get_children(),
+            key=lambda iid: key(values_by_id[int(iid)]),
+            reverse=reverse
+        )
+        for position, iid in enumerate(ordered):
+            self.treeview.move(iid, "", position)
+
+    def _sort_key(self):
+        """Return a sort key over a row's shown values for the active sort column"""
+        col, _ = self._active_sort
+        index = self.treeview["columns"].index(col)
+        key = _SORT_KEYS.get(col, _text_sort_key)
+        return lambda values: key(values[index])
+
+    def _in_sort_order(self, rows):
+        """Order rows by the active heading sort, so refreshes keep it"""
+        if self._active_sort is None:
+            return rows
+        key = self._sort_key()
+        return sorted(rows, key=lambda row: key(self._treeview_values(row)),
+                      reverse=self._active_sort[1])
 
     def _show_statistics(self):
-        """Show statistics window"""
-        StatisticsWindow(self.root, self.db_model)
+        """Show statistics window, reusing it if it was opened before"""
+        if self._stats_window is None or not self._stats_window.window.winfo_exists():
+            self._stats_window = StatisticsWindow(self.root, self.db_model)
+        else:
+            self._stats_window.show()
 
     def _on_closing(self):
         """Handle window closing"""
         self.db_model.close()
+        close_all_connections()
         self.root.destroy()
 
 
@@ -1356,6 +1700,10 @@ def main():
     """Main entry point"""
     root = tk.Tk()
     root.title(APP_NAME)
+    root.report_callback_exception = report_callback_error
+    init_fonts(root)
+    configure_styles()
+    init_icon_cache()
 
     def start_app(username):
         """Start main application with selected user"""
@@ -0,0 +1,49 @@
+# Base64 of assets/placeholder.png, embedded so the cover placeholder needs no disk access
+PLACEHOLDER_PNG_B64 = (
+    "iVBORw0KGgoAAAANSUhEUgAAAIAAAACACAYAAADDPmHLAAAABHNCSVQICAgIfAhkiAAAAAlwSFlzAAADdgAAA3YBfdWCzAAAABl0"
+    "RVh0U29mdHdhcmUAd3d3Lmlua3NjYXBlLm9yZ5vuPBoAAAzmSURBVHic7Z17sFVVHcc/v3vxKk5qaiDD7YH4SFLQUVAwcdAxHROV"
+    "QQfSUstU1Gk0ahJLJ8fKB2PT+EirufnCMdMhHwQNZSqMDqBAhVhSyr2IIhiZjC/sAv7647cPc7ics9fa++y9z7nnrM/M+ufsddb6"
+    "7f397b3XXo/fElXFFxEZCZwBjAU6ozQIEO9CAlmiwEZgXZSWAHNUdaV/CaqxCegApgPdUYUhNX7qjjTrcOrrEH9KEL5fp25gSmIH"
+    "wO76rgY4gZCySV1UeRpUEn8wsKgBjA4p27QIGNxXbylvBIpIB7AAGEegGVkMTFDV3tIPbX0y3EkQv5kZh2m8ne1PABGZAjycoLAN"
+    "wDJgFbAtIwMDyWgHDgFGA0MS/G+qqj4CkQNEj/5VwP6OP24FZgJ3qeqbKQwO5ISIDAUuB2YAAxzZe4BDVLW31PCbjrsR8Q9gjOu7"
+    "MqT6JmBMpJVLz+nbG4Ei0k383f8ycJSqbk7ml4F6ICIDgeXAiJhsPao6XICRwIsxGbcCx6rq0gxtDOSMiIzBPv3iXgej2rC+/Thm"
+    "BvH7H5FmMx3ZzmjDBnbiuCsbkwJ1wKXd2DZsRK8aG0Jrv/8SabchJkunywGWZWuSPyKyt4gcKiJjRWRY9KkaSE6chp0DsPH8aqzK"
+    "2JiKiIhgny+TgInAgcDAPtlURN7GxryfAH6vqm8VYV8/ZxV2TSsxaADxkzly7eGL7uppwFXAp13ZgU9hJzMR+FhEngKuCY3UWOI0"
+    "lL5jAYUhIudi3nk7bvEr0QZ8CXheRB4WkeFZ2tcqFO4AIrKriNwPPIi769mrSGziyl9F5NQMymspCnUAERkEPAWcn0PxewJzReS7"
+    "OZTdtLgGDTJDRPYEFhLfPVkrbcBPRWR3Vf1xjvU0DYU8AUSkDfgt+YpfzvUiMrmguvo1RT0BbgZ8388KvIJ9vy4F1gNHYGPeRwF7"
+    "e5QhwCwReVVV48Y5AsQPGd6cwfDk4diniGt48mPgNuCTjvKOBlZ4lKfAs/Uenq13wm6+qteoiFfALbhfNT3Aiap6papuisuoqi9g"
+    "nUY34O6nOE5ETve2tAXJ1QFE5GTsWz2Op4BRqrrAt1xV7VXVa4HxwEeO7DdHbZBABfK+MBc5jm8CLlDV99MUrqqLgWsc2b5AmOha"
+    "ldwcQER2AU5xZLtCVdfVWNWtwHOOPJNqrKNpyfMJcDzWOVONuar6QK2VqOrHwNeJfxWcWWs9zUqeDjDBcfyhrCpS1dXYJ2M1DhKR"
+    "uGHvliVPB/iM43jWcw1c5bnsaUnydIChMcfexTp7ssTlAHH2tCz1coDlGvVSZEhwgBTk6QBxnTS75lCfq8ywfK0CeTpA3OfdESLS"
+    "nnF9ox3Ha/3cbErydIC42cS7A4dmXN8Yx/Ewu7kCeTrAWsdx1x2bFFd5Lntakjwd4EnH8Uuyeg2IyDHAkTFZ/qaq/86irmYjTwd4"
+    "Hoi76McA36u1EhHZDbgPWytfjcdrradZyc0Boi7aeY5s14vIYTVWdQMWJCGO4ABVyHs08E5s4kE1OoDfiMiwNIWLyHnAtx3ZnlPV"
+    "FWnKbwVydQBVXY7NBYxjJLBSRC7xLVdEBonIbGAW7nOY4VtuK1LERIlrgF5Hnk8AvxKR+SJyjIhU7NQRkf1E5Hzg78BZHnXPUdVF"
+    "ycxtLXKfFKqqPSJyNfAzj+ynRGmLiKxk50mhSVYQbQSuSGhurojIkVj/x4go7QE8DfwJ+EvUbiqcXCeFlk1OvMdRV5bpf8Bx9Z6Q"
+    "WXbuncBch83/wRq07c02KbTEpcCzBdSjwGWq6polVAgi8k3slXWaI+u+wA+A+SKyb+6GRRTmAGrRKU/B3SishQ+As1X1nhzr8EJE"
+    "2kXkAeDXwF4J/noSsExEDs/Hsh0pdLasqm5W1XOAa4n/PExDDzBOVR/NuNzERD2c9wNfS1nEMOBJEflcZkZVoS7TpVX1BqwncEEG"
+    "xX2IvTsP1yQbJeREmfhfrbGoQcDjIrJ77VZVp27z5VV1qaqegAV7KEUnT8ImLAz6wap6raq+l7WNSYnWH2QhfokjsMZzbhS2Orga"
+    "qjoPmCciQ7CQdROBA7DYt/tE2XqBt7CAR89jIWIWquqW4i2uTCT+LPzE34qdx1DcMRKmisgKVb2pRhOrUshnYMpPmA4cawUbIWFP"
+    "0gcc17KUXgEOK/tf7GdalLYBp/X3z8DEqC0Bi10rWG/KHvs+Db7VwAmq+hLYgJmqXo09OeJow8ZMXINeiWloB2h0Uog/QVXfqHBs"
+    "GvCC4/97Ak+ISJJPSifBAVKSUPxuqouPqn4ETCY+qCPAwcBDWS52DQ6QgizFL6G2RnIy7oGzU4Ebfez0IThAQiLx7yOZ+K/7lK22"
+    "2vkyj6wzROQcnzJdBAdIQJn453lk7yGB+CWibuw7PLLeHY0u1kRwAE+KEL+M72DDxHEMBB4TkcEp6wCCA3iRUvzU09BVdSsW/LLH"
+    "kfWzwOwoFkMqggM4SCj+GmoUv4Sqvo3FNfjAkXU8Fm43FcEBYojEv5eCxS8RDW5dgHuc5FIRmZamjuAAVSgT3yes7RpM/NeytkNV"
+    "fwf8xCPrHSIyPmn5wQEq0Cjil3EdNgAWxy5YeyBRIIzgAH1IKP5rWN9+nuKjNqpzHrYfYByDsTkEfTfbqEpwgDJSiD9BVdfkalRE"
+    "NN/hTOAdR9Yjgbt9yw0OEBGJfw8NKH4JVX0VmIo72MU5InKVT5l1dwARGSoiJ4vIeBHZx/2PXGwoiX+BR/a12GN/Ta5GVUFVn8S2"
+    "2HFxk+8GGoVPCMGWg83B5sL3rXMD9t3dWeBkjvsc16GUXgP2r/cElMjuWR72bgIedeQpzgGwUO93YFOiXMZ/APwQGBjEr2j7btgc"
+    "Ah/b6+8A2ATHN1IYuBIYVmfx1wLD6y16hXPoxJbOpXaAonYMOR2L55smWudhwFIROT5De9qwlrLPO/91rMHXnVX9WaH+cwjiy4lJ"
+    "WWwYMR2/DSNcqRe4KKM7/17POhvyzq9wThfWcF3zcQBsyvkvMhC+b7qVlAsoE4r/OnBAvcVNcG63N4wDYBMY/5iD+KU0H9griL/T"
+    "Dfd03R0AW9f2UgIDngG+AlyMxQPw/d8q4KAg/g7nuS82Da0+DgCMxVbw+FZ+XQUv/nmC//8XOMlDfN/YBG8AB9ZbyBqdYBTwfuEO"
+    "gHVRbvas9CPg3JiyLgO2eJa1BfhWEH+H8z4L24WtGAfAlnv7VrgR+KJHmSdGd7ivJ/8S2KXVxS87/x/l7gDY2r37E4j0Mgk+q4AD"
+    "o//4lv8M9h5MKr5XW6I/JWzzzCdyc4DoQi9MIM6fSbHQE4uuMT9BPauBhz3zrmtG8cuu3R5YeJpsHQBbovRKAlG6gAE1nEg7tquo"
+    "b30tL37Ztct2dbCITACWYI9nFwpcpaoXq011ToWqblPVK4FLsEZfrbyJDelmvW1NvyORA4jIN7CYdj4bOH8InKWqt6QxrBKq2oXt"
+    "RPp2DcWsx8T/VzZW9W+8HECMG7GGlc8ihPXA8ar6WC3GVUJVF2IbSLvmx1ViPTawE8SPcDpANMHwEeD7nmWuAI5WixOcC2ojc+OA"
+    "PyT4W7jzK+BygP2wSF5ne5Y3D4vQGbsUOgtU9V3gdPxC0G7AxP9nvlb1T7JqVd9GxmFOE7R0L8TCw1ayaz1wSL1b403zFVCBbVhX"
+    "7JWqWpet2dSWVJ/EzvsCvYS981cVb1X/oNYwce8BU1R1fhbG1IKqPisin8f6wffHGolz1ULUBqpQiwOsBSZqA0TnLKEWa+fBetvR"
+    "n0j7CngBa+k3jPiBdKRxgNnYe/WtrI0JFE9SB7gJe+dvzsOYQPH4tgG2ANNU9d48jQkUj48DvANMVtUFOdsSqAMuB1gNfDl0nzYv"
+    "rjbA7CB+c1P35eGB+hIcoMUJDtDiBAdocYIDtDjBAVqc4AAtTnCAFic4QIsTHKDFCQ7Q4gQHaHHaiFaIVqG9KEMCuRGnobZhARuq"
+    "kflWpYHCidNwYxu2TLoaozM2JlA8cRqucznAEBEZmrFBgYKItBsSk2VdG7bWP47LszMpUDAu7ZYIFrr9xZhMW4FjVXVpZmYFckdE"
+    "xgCLiJ/2N0pUFRHpxpZTVeNl4KgwHbx/EC3pXw6MiMnWo6rDS/0Arr1qRwDLI68KNDCRRi7xIdK89ATowEKvxj0FwF4HM4G7VPXN"
+    "Wo0NZEfU4LscmIF7tncPtmS+V6I15IjIFCy8mi8bgGWY49RlWXiAduw7fzTxrf2+TFXVRwD6BhPoIttQbCE1Xuoq13z7EwAovQoW"
+    "YPF3As3HYmxh7/aYCTsMBkUHJkUZA83FYmDSTgEzqsSV6SC8DpopdQEdFbV2BBiaQvINCEJqnNSNLeevrrFHlKkObOOn4Aj9J3VH"
+    "mlW866s2Al2IyEjgDGxnkM4oDcJCkweKR7Hh/HVRWgLMSRK65/+hlBgSEIuiuAAAAABJRU5ErkJggg=="
+)
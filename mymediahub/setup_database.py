@@ -1,54 +1,76 @@
 import sqlite3
 import os
+from contextlib import closing
 
 USERS_DB = "users.db"
 
+# Indexes on Media used by the list, filter and statistics queries;
+# DatabaseModel also runs these so libraries created before them get them
+MEDIA_INDEXES = (
+    # Covers the library grid's columns in newest-first order, so loading the
+    # list walks the index without touching the table or sorting
+    """
+    CREATE INDEX IF NOT EXISTS idx_media_list
+    ON Media(date_added DESC, title, media_type, genre, release_year, director, rating, status)
+    """,
+    # Each filter index ends in date_added, so filtered rows also come back
+    # newest first without a sort
+    "CREATE INDEX IF NOT EXISTS idx_media_type ON Media(media_type, date_added)",
+    "CREATE INDEX IF NOT EXISTS idx_media_status ON Media(status, date_added)",
+    "CREATE INDEX IF NOT EXISTS idx_media_type_status ON Media(media_type, status, date_added)",
+    # Partial index holding only rated rows, used for the average rating
+    "CREATE INDEX IF NOT EXISTS idx_media_rating ON Media(rating) WHERE rating IS NOT NULL",
+)
 
 def setup_users_database():
     """Create the users database"""
-    conn = sqlite3.connect(USERS_DB)
-    cursor = conn.cursor()
-
-    cursor.execute("""
-    CREATE TABLE IF NOT EXISTS Users (
-        id INTEGER PRIMARY KEY AUTOINCREMENT,
-        username TEXT NOT NULL UNIQUE,
-        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-    );
-    """)
-
-    conn.commit()
-    conn.close()
+    # closing() closes the file; "with conn" commits the schema
+    with closing(sqlite3.connect(USERS_DB)) as conn, conn:
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("""
+        CREATE TABLE IF NOT EXISTS Users (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            username TEXT NOT NULL UNIQUE,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        );
+        """)
+
     print(f"Users database '{USERS_DB}' created successfully!")
 
 
 def setup_media_database(username):
     """Create a media database for a specific user"""
     db_name = f"media_library_{username}.db"
-    conn = sqlite3.connect(db_name)
-    cursor = conn.cursor()
-
-    cursor.execute("""
-    CREATE TABLE IF NOT EXISTS Media (
-        id INTEGER PRIMARY KEY AUTOINCREMENT,
-        title TEXT NOT NULL,
-        media_type TEXT NOT NULL,
-        genre TEXT,
-        release_date TEXT,
-        director TEXT,
-        description TEXT,
-        rating REAL,
-        status TEXT DEFAULT 'To Read',
-        image_path TEXT,
-        date_added TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-    );
-    """)
-
-    conn.commit()
-    conn.close()
+    with closing(sqlite3.connect(db_name, isolation_level=None)) as conn:
+        # WAL is stored in the database file, so every later connection uses it
+        conn.execute("PRAGMA journal_mode=WAL")
+
+        # The table and its indexes are created in one transaction, so a
+        # new library costs a single commit
+        conn.execute("BEGIN")
+        conn.execute("""
+        CREATE TABLE IF NOT EXISTS Media (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            title TEXT NOT NULL,
+            media_type TEXT NOT NULL,
+            genre TEXT,
+            release_date TEXT,
+            release_year INTEGER,
+            director TEXT,
+            description TEXT,
+            rating REAL,
+            status TEXT DEFAULT 'To Read',
+            image_path TEXT,
+            date_added TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        );
+        """)
+        for statement in MEDIA_INDEXES:
+            conn.execute(statement)
+        conn.execute("COMMIT")
+
     print(f"Media database '{db_name}' created for user '{username}'!")
 
 
 if __name__ == "__main__":
     setup_users_database()
-    print("Setup complete! Run main.py to start the application.")
\ No newline at end of file
+    print("Setup complete! Run main.py to start the application.")